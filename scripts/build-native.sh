@@ -120,6 +120,11 @@ echo ""
 print_info "Info command:"
 "$DIST_DIR/$BINARY_NAME" info
 
+echo ""
+print_info "Parallel processing (--jobs 2):"
+timeout 60 "$DIST_DIR/$BINARY_NAME" process \
+    --project ./test-native --config ./test-config.yml --jobs 2 --dry-run
+
 # Check file size
 FILE_SIZE=$(du -h "$DIST_DIR/$BINARY_NAME" | cut -f1)
 print_success "Native binary built successfully!"
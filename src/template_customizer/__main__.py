@@ -1,8 +1,12 @@
 """Entry point for template customizer when run as a module or with PyInstaller."""
 
+import multiprocessing
 import sys
 
 from template_customizer.cli import main
 
 if __name__ == "__main__":
+    # In a frozen executable, --jobs worker processes start by re-running
+    # this entry point; freeze_support() runs the worker instead of the CLI
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -1,18 +1,29 @@
 """Command line interface for template customizer."""
 
+import multiprocessing
 import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from . import __version__
 from .core.external_replacements import ExternalReplacementConfig
-from .core.parser import CommentParser
+from .core.parser import CommentParser, TemplateMarker
 from .core.processor import ParameterLoader, TemplateProcessor
 from .core.replacers import JSONReplacer, MarkdownReplacer
 from .core.scanner import FileScanner
@@ -114,6 +125,14 @@ def main(ctx, project, config):
     is_flag=True,
     help="Disable resolution of self-references in configuration files",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes used to analyze files",
+)
 @click.pass_context
 def process(
     ctx,
@@ -126,6 +145,7 @@ def process(
     verbose: bool,
     yes: bool,
     no_resolve_refs: bool,
+    jobs: int,
 ):
     """Process template markers in project files.
 
@@ -182,6 +202,10 @@ def process(
     # docker_image = {{ values.docker.image | quote }}
     docker_image = "default:latest"
     """
+    # Rich's progress widgets are only needed once a command actually runs,
+    # so they are imported here rather than when the CLI module loads
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         # Use global options if local ones aren't provided
         if project is None:
@@ -282,10 +306,7 @@ def process(
             exclude_patterns=list(exclude) if exclude else None,
         )
 
-        parser = CommentParser()
-        processor = TemplateProcessor(parameters)
         writer = FileWriter(backup_enabled=not dry_run)
-        file_detector = FileTypeDetector()
 
         # Show configuration summary
         _show_processing_summary(
@@ -293,124 +314,128 @@ def process(
         )
 
         # Process files
-        all_changes = []
+        all_changes: List[FileChange] = []
         processed_files = 0
         skipped_files = 0
         files_to_copy = set()  # Track all files that need to be copied
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            scan_task = progress.add_task("Scanning files...", total=None)
-
-            files_to_process = list(scanner.scan())
-            progress.update(
-                scan_task, description=f"Found {len(files_to_process)} files to scan"
-            )
-
-            process_task = progress.add_task(
-                "Processing files...", total=len(files_to_process)
+        with ExitStack() as stack:
+            # Files are analyzed independently of each other, so with --jobs
+            # they are spread over worker processes; results still arrive in
+            # scan order. The pool is set up before the progress display
+            # starts its refresh thread, and its workers are never forked.
+            results: Iterable[_FileResult]
+            if jobs > 1:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=jobs,
+                        mp_context=_worker_context(),
+                        initializer=_init_worker,
+                        initargs=(parameters,),
+                    )
+                )
+                results = _analyze_in_pool(executor, scanner.scan(), jobs * 32)
+            else:
+                results = map(_FileAnalyzer(parameters), scanner.scan())
+
+            progress = stack.enter_context(
+                Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                    transient=True,
+                )
             )
+            # Files are processed as the scanner yields them, so the total is
+            # unknown until the walk finishes
+            process_task = progress.add_task("Processing files...", total=None)
 
-            for file_path in files_to_process:
+            for result in results:
+                file_path = result.file_path
                 progress.update(
                     process_task, description=f"Processing {file_path.name}"
                 )
 
-                # Check if file type is supported
-                if not file_detector.is_supported_file(file_path):
-                    skipped_files += 1
-                    if verbose:
-                        console.print(
-                            f"[yellow]Skipped:[/yellow] {file_path} "
-                            f"(unsupported file type)"
-                        )
-                    progress.advance(process_task)
-                    continue
-
-                # Parse template markers
+                # Handle each result on its own, so that one file that cannot
+                # be mapped or reported does not abort the whole run
                 try:
-                    markers = parser.parse_file(file_path)
-                except Exception as e:
-                    console.print(f"[red]Error parsing {file_path}:[/red] {e}")
-                    progress.advance(process_task)
-                    continue
-
-                if not markers:
-                    skipped_files += 1
-                    if verbose:
-                        console.print(
-                            f"[yellow]Skipped:[/yellow] {file_path} "
-                            f"(no template markers)"
-                        )
-
-                    # If output directory is specified, track file for copying
-                    if output:
-                        files_to_copy.add(file_path)
-
-                    progress.advance(process_task)
-                    continue
-
-                # Process markers
-                try:
-                    result = processor.process_markers(markers)
-                    markers_and_values, marker_errors = result
-
-                    # Display warnings for missing markers
-                    if marker_errors:
+                    if result.status == "unsupported":
+                        skipped_files += 1
+                        if verbose:
+                            console.print(
+                                f"[yellow]Skipped:[/yellow] {file_path} "
+                                f"(unsupported file type)"
+                            )
+                    elif result.status == "parse_error":
                         console.print(
-                            f"[yellow]⚠ Warning:[/yellow] {file_path.name} has "
-                            f"{len(marker_errors)} missing values:"
+                            f"[red]Error parsing {file_path}:[/red] {result.error}"
                         )
-                        for marker, error_msg in marker_errors:
+                    elif result.status == "no_markers":
+                        skipped_files += 1
+                        if verbose:
                             console.print(
-                                f"  [yellow]Line {marker.line_number + 1}:[/yellow] "
-                                f"{marker.variable_name} - {error_msg}"
+                                f"[yellow]Skipped:[/yellow] {file_path} "
+                                f"(no template markers)"
                             )
 
-                    # Determine target file path
-                    if output:
-                        # Calculate relative path from project root
-                        rel_path = file_path.relative_to(project)
-                        target_path = output / rel_path
+                        # If output directory is specified, track file for copying
+                        if output:
+                            files_to_copy.add(file_path)
                     else:
-                        target_path = file_path
-
-                    changes = writer.prepare_changes(file_path, markers_and_values)
+                        marker_errors = result.marker_errors
 
-                    if changes:
-                        # Update changes to use target path if output directory
-                        # is specified
-                        if output:
-                            changes = [
-                                FileChange(
-                                    file_path=target_path,
-                                    line_number=c.line_number,
-                                    old_content=c.old_content,
-                                    new_content=c.new_content,
-                                    marker=c.marker,
+                        # Display warnings for missing markers
+                        if marker_errors:
+                            console.print(
+                                f"[yellow]⚠ Warning:[/yellow] {file_path.name} has "
+                                f"{len(marker_errors)} missing values:"
+                            )
+                            for marker, error_msg in marker_errors:
+                                console.print(
+                                    f"  [yellow]Line {marker.line_number + 1}:"
+                                    f"[/yellow] {marker.variable_name} - "
+                                    f"{error_msg}"
                                 )
-                                for c in changes
-                            ]
-
-                        all_changes.extend(changes)
-                        processed_files += 1
 
-                        # Track file for copying
-                        if output:
-                            files_to_copy.add(file_path)
-
-                        if verbose:
+                        if result.status == "process_error":
                             console.print(
-                                f"[green]Processed:[/green] {file_path} "
-                                f"({len(changes)} changes)"
+                                f"[red]Error processing {file_path}:[/red] "
+                                f"{result.error}"
                             )
-                    else:
+                        elif result.changes:
+                            changes = result.changes
+
+                            # Update changes to use target path if output directory
+                            # is specified
+                            if output:
+                                # Calculate relative path from project root
+                                rel_path = file_path.relative_to(project)
+                                target_path = output / rel_path
+                                changes = [
+                                    FileChange(
+                                        file_path=target_path,
+                                        line_number=c.line_number,
+                                        old_content=c.old_content,
+                                        new_content=c.new_content,
+                                        marker=c.marker,
+                                    )
+                                    for c in changes
+                                ]
+
+                            all_changes.extend(changes)
+                            processed_files += 1
+
+                            # Track file for copying
+                            if output:
+                                files_to_copy.add(file_path)
+
+                            if verbose:
+                                console.print(
+                                    f"[green]Processed:[/green] {file_path} "
+                                    f"({len(changes)} changes)"
+                                )
                         # No changes but file has markers (possibly all failed)
-                        if markers_and_values or marker_errors:
+                        elif result.has_values or marker_errors:
                             processed_files += 1
                             if verbose:
                                 console.print(
@@ -604,6 +629,114 @@ def process(
         sys.exit(1)
 
 
+class _FileResult(NamedTuple):
+    """Outcome of analyzing one scanned file for template markers."""
+
+    file_path: Path
+    status: str  # unsupported, parse_error, no_markers, processed, process_error
+    error: str = ""
+    marker_errors: Sequence[Tuple[TemplateMarker, str]] = ()
+    has_values: bool = False
+    changes: Sequence[FileChange] = ()
+
+
+class _FileAnalyzer:
+    """Find a file's template markers and the changes their values call for.
+
+    Results only contain picklable values so that files can be analyzed in
+    worker processes.
+    """
+
+    def __init__(self, parameters: dict):
+        self.file_detector = FileTypeDetector()
+        self.parser = CommentParser()
+        self.processor = TemplateProcessor(parameters)
+        self.writer = FileWriter(backup_enabled=False)
+
+    def __call__(self, file_path: Path) -> _FileResult:
+        # Check if file type is supported
+        if not self.file_detector.is_supported_file(file_path):
+            return _FileResult(file_path, "unsupported")
+
+        # Parse template markers
+        try:
+            markers = self.parser.parse_file(file_path)
+        except Exception as e:
+            return _FileResult(file_path, "parse_error", error=str(e))
+
+        if not markers:
+            return _FileResult(file_path, "no_markers")
+
+        # Process markers
+        marker_errors: List[Tuple[TemplateMarker, str]] = []
+        try:
+            markers_and_values, marker_errors = self.processor.process_markers(markers)
+            changes = self.writer.prepare_changes(file_path, markers_and_values)
+        except Exception as e:
+            return _FileResult(
+                file_path, "process_error", error=str(e), marker_errors=marker_errors
+            )
+        return _FileResult(
+            file_path,
+            "processed",
+            marker_errors=marker_errors,
+            has_values=bool(markers_and_values),
+            changes=changes,
+        )
+
+
+# Analyzer of a --jobs worker process, set up once by _init_worker
+_worker_analyzer: _FileAnalyzer
+
+
+def _init_worker(parameters: dict) -> None:
+    """Build the worker process's analyzer from the resolved parameters."""
+    global _worker_analyzer
+    _worker_analyzer = _FileAnalyzer(parameters)
+
+
+def _analyze_in_worker(file_path: Path) -> _FileResult:
+    """Analyze a file with the worker process's analyzer."""
+    return _worker_analyzer(file_path)
+
+
+def _worker_context() -> BaseContext:
+    """Start method for --jobs workers that does not fork the CLI process.
+
+    Forking copies whatever locks the parent's threads (such as the progress
+    display's refresh thread) hold at that moment.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _analyze_in_pool(
+    executor: Executor, file_paths: Iterable[Path], max_pending: int
+) -> Iterator[_FileResult]:
+    """Analyze files in worker processes, yielding results in scan order.
+
+    At most ``max_pending`` files are queued ahead of the one being waited
+    for. A file whose analysis fails in the pool (for example because its
+    result cannot be pickled) is reported as a process_error result.
+    """
+    pending: Deque[Tuple[Path, Future[_FileResult]]] = deque()
+    for file_path in file_paths:
+        pending.append((file_path, executor.submit(_analyze_in_worker, file_path)))
+        if len(pending) >= max_pending:
+            yield _future_result(*pending.popleft())
+    while pending:
+        yield _future_result(*pending.popleft())
+
+
+def _future_result(file_path: Path, future: "Future[_FileResult]") -> _FileResult:
+    """Result of one file's analysis, or a process_error if it failed."""
+    try:
+        return future.result()
+    except Exception as e:
+        return _FileResult(file_path, "process_error", error=str(e))
+
+
 def _show_processing_summary(
     project: Path,
     config: Path,
@@ -614,6 +747,7 @@ def _show_processing_summary(
     output: Optional[Path] = None,
 ):
     """Show processing configuration summary."""
+    from rich.panel import Panel
 
     panel_content = []
     panel_content.append(f"📁 Project: {project}")
@@ -644,6 +778,7 @@ def _show_processing_summary(
 
 def _show_results(changes, processed_files, skipped_files, dry_run, verbose):
     """Show processing results."""
+    from rich.table import Table
 
     if not changes:
         console.print("\n[yellow]No changes to apply[/yellow]")
@@ -691,6 +826,7 @@ def _show_results(changes, processed_files, skipped_files, dry_run, verbose):
 @click.pass_context
 def info(ctx):
     """Show information about supported file types and syntax."""
+    from rich.panel import Panel
 
     # Display version information
     console.print(f"[blue]Template Customizer v{__version__}[/blue]")
@@ -12,18 +12,34 @@ class ConfigurationError(Exception):
 class CircularReferenceError(ConfigurationError):
     """Raised when circular dependencies are detected in configuration references."""
 
-    def __init__(self, cycle_path: List[str], message: Optional[str] = None):
+    def __init__(
+        self,
+        cycle_path: List[str],
+        message: Optional[str] = None,
+        cycles: Optional[List[List[str]]] = None,
+    ):
         """Initialize circular reference error.
 
         Args:
             cycle_path: List of reference keys that form the circular dependency
             message: Optional custom error message
+            cycles: Every cycle found, when there is more than one; cycle_path
+                is expected to be the first of them
         """
         self.cycle_path = cycle_path
+        self.cycles = cycles if cycles is not None else [cycle_path]
+        # Rendered once; the cycle is closed by repeating its first key
+        self.cycle_display = " → ".join([*cycle_path, cycle_path[0]])
 
         if message is None:
-            cycle_display = " → ".join(cycle_path + [cycle_path[0]])
-            message = f"Circular dependency detected: {cycle_display}"
+            if len(self.cycles) == 1:
+                message = f"Circular dependency detected: {self.cycle_display}"
+            else:
+                displays = [" → ".join([*cycle, cycle[0]]) for cycle in self.cycles]
+                message = (
+                    f"Circular dependency detected in {len(displays)} cycles: "
+                    + "; ".join(displays)
+                )
 
         super().__init__(message)
 
@@ -51,13 +67,13 @@ class ReferenceResolutionError(ConfigurationError):
         self.line_number = line_number
 
         if message is None:
-            location_info = ""
+            parts = [f"Reference '{reference}' not found"]
             if line_number is not None:
-                location_info = f" at line {line_number}"
+                parts.append(f"at line {line_number}")
             if config_path is not None:
-                location_info += f" in {config_path}"
+                parts.append(f"in {config_path}")
 
-            message = f"Reference '{reference}' not found{location_info}"
+            message = " ".join(parts)
 
         super().__init__(message)
 
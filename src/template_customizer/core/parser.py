@@ -4,6 +4,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
+from ..utils.io import read_lines
+
 
 class TemplateMarker(NamedTuple):
     """Represents a template marker found in a comment."""
@@ -62,12 +64,12 @@ class CommentParser:
         Returns:
             List of TemplateMarker objects found in the file
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File does not exist: {file_path}")
-
+        # Scanned files are known to exist, so the file is opened directly
+        # rather than stat()ed first
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = read_lines(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File does not exist: {file_path}") from None
         except UnicodeDecodeError:
             # Skip binary files
             return []
@@ -1,8 +1,10 @@
 """Template processing and rendering module."""
 
+import copy
+import io
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from jinja2 import BaseLoader, Environment, TemplateError, UndefinedError
@@ -16,6 +18,34 @@ from .exceptions import (
 from .parser import TemplateMarker
 from .resolver import ConfigResolver
 
+# Prefer the libyaml-backed loader; it is several times faster than the
+# pure-Python one and accepts exactly the same (safe) documents
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# orjson is an optional speedup for JSON configuration files
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _parse_json(data: bytes) -> Any:
+    """Parse a JSON document, with orjson when it is installed.
+
+    orjson is stricter than the standard library (e.g. no NaN or integers
+    beyond 64 bits), so documents it rejects are parsed again with json,
+    which raises the error if the document really is invalid.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 class ParameterLoader:
     """Loads and processes configuration parameters from YAML or JSON files.
@@ -36,7 +66,8 @@ class ParameterLoader:
     - Backward compatibility with --no-resolve-refs option
 
     Attributes:
-        config_path (Path): Path to the configuration file
+        config_path (Optional[Path]): Path to the configuration file, None when
+            the configuration is given in memory
         resolve_references (bool): Whether to resolve self-references
         verbose (bool): Whether to output detailed resolution information
         resolver (ConfigResolver): Resolver instance for reference resolution
@@ -55,13 +86,27 @@ class ParameterLoader:
         Compatibility mode (no reference resolution):
         >>> loader = ParameterLoader(Path("config.yml"), resolve_references=False)
         >>> config = loader.load()  # References remain as template strings
+
+        In-memory configuration (no file access):
+        >>> loader = ParameterLoader(text=yaml_text)
+        >>> loader = ParameterLoader(data={"name": "demo"})
     """
 
     def __init__(
-        self, config_path: Path, resolve_references: bool = True, verbose: bool = False
+        self,
+        config_path: Optional[Path] = None,
+        resolve_references: bool = True,
+        verbose: bool = False,
+        env: Optional[Environment] = None,
+        *,
+        text: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
     ):
         """Initialize parameter loader with optional reference resolution.
 
+        The configuration comes from exactly one of ``config_path``, ``text``
+        or ``data``.
+
         Args:
             config_path: Path to configuration file (YAML or JSON)
             resolve_references: Whether to resolve self-references in configuration.
@@ -70,11 +115,30 @@ class ParameterLoader:
             verbose: Whether to enable verbose output for resolution details.
                     Shows dependency graph, resolution order, and step-by-step
                     resolution process when resolve_references=True.
+            env: Jinja2 environment the resolver renders references with.
+                 Defaults to the environment shared by all resolvers.
+            text: Configuration as YAML (or JSON) text, parsed without
+                  touching the filesystem
+            data: Configuration that is already parsed; only references are
+                  resolved
+
+        Raises:
+            ValueError: If not exactly one configuration source is given
         """
-        self.config_path = Path(config_path)
+        sources = [config_path, text, data]
+        if sum(source is not None for source in sources) != 1:
+            raise ValueError(
+                "Exactly one of config_path, text or data must be provided"
+            )
+
+        self.config_path = Path(config_path) if config_path is not None else None
+        self.text = text
+        self.data = data
         self.resolve_references = resolve_references
         self.verbose = verbose
-        self.resolver = ConfigResolver(verbose=verbose) if resolve_references else None
+        self.resolver = (
+            ConfigResolver(verbose=verbose, env=env) if resolve_references else None
+        )
 
     def load(self) -> Dict[str, Any]:
         """Load and process parameters from configuration file.
@@ -108,67 +172,87 @@ class ParameterLoader:
             >>> config = loader.load()
             >>> # {{ values.project.name }} remains as template string
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        if self.config_path is None:
+            return self._resolve(self._parse_in_memory())
 
+        config_path = self.config_path
         try:
-            with open(self.config_path, encoding="utf-8") as f:
-                if self.config_path.suffix.lower() in [".yml", ".yaml"]:
-                    config = yaml.safe_load(f) or {}
-                elif self.config_path.suffix.lower() == ".json":
-                    config = json.load(f)
-                else:
-                    # Try YAML first, then JSON
-                    content = f.read()
-                    try:
-                        config = yaml.safe_load(content) or {}
-                    except yaml.YAMLError:
-                        config = json.loads(content)
-
-            # Resolve self-references if enabled
-            if self.resolve_references and self.resolver:
-                try:
-                    if self.verbose:
-                        print("🔄 Resolving self-references in configuration...")
-                    config = self.resolver.resolve(config)
-                    if self.verbose:
-                        print("✅ Successfully resolved configuration references")
-                except CircularReferenceError as e:
-                    raise ValueError(
-                        f"Circular dependency detected in configuration file "
-                        f"'{self.config_path}':\n"
-                        f"  {str(e)}\n"
-                        f"  Please check your configuration for references that "
-                        f"form a loop."
-                    ) from e
-                except ReferenceResolutionError as e:
-                    raise ValueError(
-                        f"Reference resolution failed in configuration file "
-                        f"'{self.config_path}':\n"
-                        f"  {str(e)}\n"
-                        f"  Please ensure all referenced values exist in your "
-                        f"configuration."
-                    ) from e
-                except MaxRecursionError as e:
-                    raise ValueError(
-                        f"Maximum recursion depth exceeded in configuration file "
-                        f"'{self.config_path}':\n"
-                        f"  {str(e)}\n"
-                        f"  This usually indicates a very complex dependency chain "
-                        f"or circular references."
-                    ) from e
-                except TemplateSyntaxError as e:
-                    raise ValueError(
-                        f"Template syntax error in configuration file "
-                        f"'{self.config_path}':\n"
-                        f"  {str(e)}\n"
-                        f"  Please check your Jinja2 template syntax."
-                    ) from e
-
-            return config
+            if config_path.suffix.lower() == ".json":
+                config = _parse_json(config_path.read_bytes())
+            else:
+                with open(config_path, encoding="utf-8") as f:
+                    if config_path.suffix.lower() in [".yml", ".yaml"]:
+                        config = yaml.load(f, Loader=_YamlLoader) or {}
+                    else:
+                        # Try YAML first, then JSON
+                        content = f.read()
+                        try:
+                            config = yaml.load(content, Loader=_YamlLoader) or {}
+                        except yaml.YAMLError:
+                            config = json.loads(content)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {config_path}"
+            ) from None
         except (yaml.YAMLError, json.JSONDecodeError) as e:
             raise ValueError(f"Invalid configuration file format: {e}") from e
 
+        return self._resolve(config)
+
+    def _parse_in_memory(self) -> Dict[str, Any]:
+        """Parse the configuration given as text, or copy the given data."""
+        if self.data is not None:
+            return copy.deepcopy(self.data)
+        try:
+            return yaml.load(io.StringIO(self.text), Loader=_YamlLoader) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid configuration file format: {e}") from e
+
+    def _resolve(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve self-references in a parsed configuration if enabled."""
+        if not (self.resolve_references and self.resolver):
+            return config
+
+        source = self.config_path if self.config_path is not None else "<memory>"
+        try:
+            if self.verbose:
+                print("🔄 Resolving self-references in configuration...")
+            config = self.resolver.resolve(config)
+            if self.verbose:
+                print("✅ Successfully resolved configuration references")
+        except CircularReferenceError as e:
+            raise ValueError(
+                f"Circular dependency detected in configuration file "
+                f"'{source}':\n"
+                f"  {str(e)}\n"
+                f"  Please check your configuration for references that "
+                f"form a loop."
+            ) from e
+        except ReferenceResolutionError as e:
+            raise ValueError(
+                f"Reference resolution failed in configuration file "
+                f"'{source}':\n"
+                f"  {str(e)}\n"
+                f"  Please ensure all referenced values exist in your "
+                f"configuration."
+            ) from e
+        except MaxRecursionError as e:
+            raise ValueError(
+                f"Maximum recursion depth exceeded in configuration file "
+                f"'{source}':\n"
+                f"  {str(e)}\n"
+                f"  This usually indicates a very complex dependency chain "
+                f"or circular references."
+            ) from e
+        except TemplateSyntaxError as e:
+            raise ValueError(
+                f"Template syntax error in configuration file "
+                f"'{source}':\n"
+                f"  {str(e)}\n"
+                f"  Please check your Jinja2 template syntax."
+            ) from e
+        return config
+
 
 class TemplateProcessor:
     """Processes template markers and renders values."""
@@ -11,6 +11,8 @@ from jsonpath_ng.exceptions import JsonPathParserError
 
 from ..external_replacements import ExternalReplacementError
 
+_INDENTED_KEY_RE = re.compile(r'^(\s+)"')
+
 
 class JSONReplacer:
     """Handles JSON file replacements using JSONPath expressions."""
@@ -216,7 +218,7 @@ class JSONReplacer:
 
         for line in lines:
             # Look for lines that start with spaces
-            match = re.match(r'^(\s+)"', line)
+            match = _INDENTED_KEY_RE.match(line)
             if match:
                 return len(match.group(1))
 
@@ -36,9 +36,10 @@ Error Handling:
 
 import re
 from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from jinja2 import BaseLoader, Environment, TemplateError, UndefinedError
+from jinja2 import BaseLoader, Environment, Template, TemplateError, UndefinedError
 
 from .exceptions import (
     CircularReferenceError,
@@ -48,6 +49,38 @@ from .exceptions import (
 )
 
 
+def _create_jinja_env() -> Environment:
+    """Create the Jinja2 environment used to render configuration references.
+
+    Template sources come from the configuration itself and never change
+    while a process runs, so there is nothing to auto-reload.
+
+    Returns:
+        Environment with the filters available to configuration references
+    """
+    env = Environment(loader=BaseLoader(), auto_reload=False)
+    env.filters.update(
+        {
+            "lower": str.lower,
+            "upper": str.upper,
+            "title": str.title,
+            "replace": lambda s, old, new: str(s).replace(old, new),
+        }
+    )
+    return env
+
+
+# Shared by all resolvers: building an Environment sets up its lexer, filters
+# and globals, which is wasted work to repeat for every configuration loaded
+_JINJA_ENV = _create_jinja_env()
+
+
+@lru_cache(maxsize=2048)
+def _compile_shared(source: str) -> Template:
+    """Compile a template string with the shared environment, once per process."""
+    return _JINJA_ENV.from_string(source)
+
+
 class ConfigResolver:
     """Resolves self-references in configuration dictionaries.
 
@@ -58,18 +91,21 @@ class ConfigResolver:
     The resolver works by:
     1. Scanning the configuration for reference patterns
     2. Building a dependency graph of all references
-    3. Detecting circular dependencies using depth-first search
-    4. Topologically sorting dependencies for optimal resolution order
-    5. Resolving references in multiple passes if needed
-    6. Preserving original data types for pure references
+    3. Detecting circular dependencies and topologically sorting the graph
+       in a single depth-first search
+    4. Resolving references in multiple passes if needed
+    5. Preserving original data types for pure references
 
     Attributes:
         max_depth (int): Maximum allowed reference chain depth (default: 10)
         verbose (bool): Whether to output detailed resolution information
-        resolution_cache (Dict[str, Any]): Cache of resolved values
+        resolution_cache (Dict[str, Any]): Final values of key paths that are
+            fully resolved, keyed by dotted path
         resolution_stack (List[str]): Current resolution stack for cycle detection
         resolution_trace (List[str]): Trace of resolution steps for debugging
-        jinja_env (Environment): Jinja2 environment for template rendering
+        jinja_env (Environment): Jinja2 environment for template rendering,
+            shared by all resolvers unless one is passed in
+        template_cache (Dict[str, Template]): Compiled templates keyed by source
 
     Examples:
         Basic resolution:
@@ -99,29 +135,39 @@ class ConfigResolver:
     # Pattern to match Jinja2 references like {{ values.project.name }}
     REFERENCE_PATTERN = re.compile(r"\{\{\s*values\.([^}]+?)\s*\}\}")
 
-    def __init__(self, max_depth: int = 10, verbose: bool = False):
+    # Pattern for a value that is nothing but a single reference (no filters or
+    # surrounding text); such values keep the referenced value's type
+    PURE_REFERENCE_PATTERN = re.compile(
+        r"^\s*\{\{\s*values\.([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\}\}\s*$"
+    )
+
+    # Pattern for plain references inside interpolated strings; a string whose
+    # only template syntax is such references is substituted without Jinja2
+    SIMPLE_REFERENCE_PATTERN = re.compile(
+        r"\{\{\s*values\.([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\}\}"
+    )
+
+    def __init__(
+        self,
+        max_depth: int = 10,
+        verbose: bool = False,
+        env: Optional[Environment] = None,
+    ):
         """Initialize resolver with maximum recursion depth.
 
         Args:
             max_depth: Maximum levels of reference chaining allowed
             verbose: Whether to enable verbose tracing output
+            env: Jinja2 environment to render references with; defaults to
+                the environment shared by all resolvers
         """
         self.max_depth = max_depth
         self.verbose = verbose
         self.resolution_cache: Dict[str, Any] = {}
         self.resolution_stack: List[str] = []
         self.resolution_trace: List[str] = []
-        self.jinja_env = Environment(loader=BaseLoader())
-
-        # Add common Jinja2 filters
-        self.jinja_env.filters.update(
-            {
-                "lower": str.lower,
-                "upper": str.upper,
-                "title": str.title,
-                "replace": lambda s, old, new: str(s).replace(old, new),
-            }
-        )
+        self.jinja_env = env if env is not None else _JINJA_ENV
+        self.template_cache: Dict[str, Template] = {}
 
     def resolve(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve all references in the configuration.
@@ -130,10 +176,10 @@ class ConfigResolver:
         a multi-step process to safely resolve all self-references:
 
         1. Builds a dependency graph of all references in the configuration
-        2. Detects circular dependencies using depth-first search
-        3. Topologically sorts dependencies for optimal resolution order
-        4. Resolves references in multiple passes if needed
-        5. Preserves original data types for pure references
+        2. Detects circular dependencies and topologically sorts dependencies
+           in a single depth-first search
+        3. Resolves references in multiple passes if needed
+        4. Preserves original data types for pure references
 
         The method is designed to handle complex scenarios including:
         - Chained references (A references B which references C)
@@ -188,13 +234,8 @@ class ConfigResolver:
                         f"   {node} depends on: {', '.join(deps)}"
                     )
 
-        # Check for circular dependencies
-        cycle = self._detect_circular_dependencies(dependency_graph)
-        if cycle:
-            raise CircularReferenceError(cycle)
-
-        # Get resolution order
-        resolution_order = self._topological_sort(dependency_graph)
+        # Get resolution order, failing on circular dependencies
+        resolution_order = self._resolution_order(dependency_graph)
         if self.verbose:
             self.resolution_trace.append(
                 f"📋 Resolution order: {' → '.join(resolution_order)}"
@@ -203,24 +244,36 @@ class ConfigResolver:
         # Create a deep copy for resolution
         resolved_config = self._deep_copy(config)
 
-        # Resolve references in order, with multiple passes if needed
+        # Resolve references in order, with multiple passes if needed. A key
+        # path is memoized in resolution_cache once everything it depends on
+        # was already final when it was rendered; later passes skip it. In
+        # topological order that is normally every key path after one pass,
+        # so no further pass is needed to confirm nothing changes.
+        requirements = self._settle_requirements(dependency_graph, resolution_order)
         max_iterations = 5  # Prevent infinite loops
         iteration = 0
 
         while iteration < max_iterations:
             changes_made = False
-            self.resolution_cache.clear()  # Clear cache each iteration
 
             for key_path in resolution_order:
-                old_value = self._get_nested_value_safe(resolved_config, key_path)
-                self._resolve_key_path(key_path, resolved_config, config)
-                new_value = self._get_nested_value_safe(resolved_config, key_path)
-                if old_value != new_value:
+                if key_path in self.resolution_cache:
+                    continue
+
+                changed, new_value = self._resolve_key_path(
+                    key_path, resolved_config, config
+                )
+                if changed:
                     changes_made = True
 
+                if all(dep in self.resolution_cache for dep in requirements[key_path]):
+                    self.resolution_cache[key_path] = new_value
+
             if not changes_made:
                 break
             iteration += 1
+            if len(self.resolution_cache) == len(resolution_order):
+                break
 
         if self.verbose:
             self.resolution_trace.append(
@@ -231,13 +284,6 @@ class ConfigResolver:
 
         return resolved_config
 
-    def _get_nested_value_safe(self, config: Dict[str, Any], key_path: str) -> Any:
-        """Get nested value safely, returning None if not found."""
-        try:
-            return self._get_nested_value(config, key_path)
-        except KeyError:
-            return None
-
     def _detect_references(self, value: Any) -> List[str]:
         """Find Jinja2 references in a value.
 
@@ -247,7 +293,9 @@ class ConfigResolver:
         Returns:
             List of reference paths found (e.g., ['project.name', 'api.host'])
         """
-        if not isinstance(value, str):
+        # Cheap substring check first: most values are plain strings and never
+        # need to enter the regex engine
+        if not isinstance(value, str) or "{{" not in value:
             return []
 
         matches = self.REFERENCE_PATTERN.findall(value)
@@ -264,25 +312,20 @@ class ConfigResolver:
         """
         graph = defaultdict(set)
 
-        def scan_dict(
-            obj: Dict[str, Any],
-            prefix: str = "",
-            path_components: Optional[List[str]] = None,
-        ):
-            if path_components is None:
-                path_components = []
-
+        def scan_dict(obj: Dict[str, Any], prefix: str = ""):
+            # prefix is the parent's key path including the trailing dot, so
+            # each level costs one string concatenation rather than a join
+            # over every component above it
             for key, value in obj.items():
-                current_components = path_components + [key]
-                current_path = ".".join(current_components)
+                current_path = f"{prefix}{key}"
 
                 if isinstance(value, dict):
-                    scan_dict(value, current_path, current_components)
+                    scan_dict(value, current_path + ".")
                 elif isinstance(value, list):
                     # For lists, we track dependencies at the list level
                     for item in value:
                         if isinstance(item, dict):
-                            scan_dict(item, current_path, current_components)
+                            scan_dict(item, current_path + ".")
                         else:
                             refs = self._detect_references(item)
                             graph[current_path].update(refs)
@@ -293,106 +336,167 @@ class ConfigResolver:
         scan_dict(config)
         return dict(graph)
 
-    def _topological_sort(self, graph: Dict[str, Set[str]]) -> List[str]:
-        """Perform topological sort to determine resolution order.
+    def _resolution_order(self, graph: Dict[str, Set[str]]) -> List[str]:
+        """Order key paths so that every dependency precedes its dependents.
+
+        Runs Tarjan's strongly connected components algorithm as a single
+        iterative depth-first search. Components are completed in post-order,
+        so dependencies are emitted before the key paths that reference them,
+        which is already a valid resolution order. Any component with more
+        than one key path, or a key path referencing itself, is a cycle; all
+        of them are collected before failing so that every cycle is reported
+        at once.
 
         Args:
             graph: Dependency graph
 
         Returns:
-            List of key paths in resolution order
-        """
-        # Calculate in-degrees - how many dependencies each node has
-        in_degree = defaultdict(int)
-        all_nodes = set(graph.keys())
-
-        # Add all referenced nodes to all_nodes
-        for node in graph:
-            for dependency in graph[node]:
-                all_nodes.add(dependency)
-
-        # Calculate in-degrees for all nodes
-        for node in all_nodes:
-            in_degree[node] = 0  # Initialize
-
-        for node in graph:
-            for _dependency in graph[node]:
-                in_degree[node] += 1
-
-        # Initialize queue with nodes that have no dependencies
-        queue = deque([node for node in all_nodes if in_degree[node] == 0])
-        result = []
-
-        while queue:
-            node = queue.popleft()
-            result.append(node)
+            List of key paths in resolution order (including referenced paths
+            that have no entry of their own in the graph)
 
-            # Reduce in-degree for nodes that depend on this node
-            for dependent in graph:
-                if node in graph[dependent]:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        queue.append(dependent)
-
-        return result
-
-    def _detect_circular_dependencies(
-        self, graph: Dict[str, Set[str]]
-    ) -> Optional[List[str]]:
-        """Detect circular dependencies using DFS.
+        Raises:
+            CircularReferenceError: If the graph contains one or more cycles
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        order: List[str] = []
+        cycles: List[List[str]] = []
+
+        for root in graph:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            pending = [(root, iter(graph[root]))]
+
+            while pending:
+                node, dependencies = pending[-1]
+                for dependency in dependencies:
+                    if dependency not in index:
+                        index[dependency] = lowlink[dependency] = len(index)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        pending.append((dependency, iter(graph.get(dependency, ()))))
+                        break
+                    if dependency in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dependency])
+                else:
+                    # All dependencies explored; propagate to the parent
+                    pending.pop()
+                    if pending:
+                        parent = pending[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] != index[node]:
+                        continue
+
+                    # node is the root of a strongly connected component
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+
+                    if len(component) > 1 or node in graph.get(node, ()):
+                        cycles.append(self._find_cycle(graph, component))
+                    else:
+                        order.append(node)
+
+        if cycles:
+            cycles.sort()
+            raise CircularReferenceError(cycles[0], cycles=cycles)
+
+        return order
+
+    @staticmethod
+    def _settle_requirements(
+        graph: Dict[str, Set[str]], resolution_order: List[str]
+    ) -> Dict[str, List[str]]:
+        """Map each key path to the paths that must be final before it is.
+
+        Leaf paths depend on the references they contain. Referenced
+        intermediate paths (e.g. a whole mapping) have no entry of their own
+        in the graph; they are final once every leaf below them is.
 
         Args:
             graph: Dependency graph
+            resolution_order: Key paths in resolution order
 
         Returns:
-            List representing the circular dependency path, or None if no cycles
+            Dictionary mapping each key path to its prerequisite key paths
         """
-        visited = set()
-        rec_stack = set()
+        requirements: Dict[str, List[str]] = {}
+        for key_path in resolution_order:
+            if key_path in graph:
+                requirements[key_path] = list(graph[key_path])
+            else:
+                prefix = key_path + "."
+                requirements[key_path] = [n for n in graph if n.startswith(prefix)]
+        return requirements
+
+    @staticmethod
+    def _find_cycle(graph: Dict[str, Set[str]], component: List[str]) -> List[str]:
+        """Pick a concrete cycle out of a strongly connected component.
+
+        Searches breadth-first from the smallest key path back to itself,
+        staying inside the component, so the reported cycle is a shortest one
+        through that key path and is the same whichever node the search
+        entered the component from.
 
-        def dfs(node: str, path: List[str]) -> Optional[List[str]]:
-            if node in rec_stack:
-                # Found cycle - return the cycle path
-                cycle_start = path.index(node)
-                return path[cycle_start:]
-
-            if node in visited:
-                return None
-
-            visited.add(node)
-            rec_stack.add(node)
-
-            for dependency in graph.get(node, set()):
-                cycle = dfs(dependency, path + [dependency])
-                if cycle:
-                    return cycle
+        Args:
+            graph: Dependency graph
+            component: Key paths of a strongly connected component that
+                contains a cycle
 
-            rec_stack.remove(node)
-            return None
+        Returns:
+            Key paths forming a cycle, starting at the component's smallest
+            member and without repeating it at the end
+        """
+        members = set(component)
+        start = min(component)
+        parents: Dict[str, str] = {}
+        queue = deque([start])
 
-        for node in graph:
-            if node not in visited:
-                cycle = dfs(node, [node])
-                if cycle:
+        while queue:
+            node = queue.popleft()
+            for dependency in sorted(graph.get(node, ())):
+                if dependency == start:
+                    cycle = [node]
+                    while cycle[-1] != start:
+                        cycle.append(parents[cycle[-1]])
+                    cycle.reverse()
                     return cycle
+                if dependency in members and dependency not in parents:
+                    parents[dependency] = node
+                    queue.append(dependency)
 
-        return None
+        return sorted(component)  # unreachable for a non-trivial component
 
     def _resolve_key_path(
         self,
         key_path: str,
         resolved_config: Dict[str, Any],
         original_config: Dict[str, Any],
-    ) -> None:
+    ) -> Tuple[bool, Any]:
         """Resolve a specific key path in the configuration.
 
         Args:
             key_path: Dot-separated key path (e.g., 'project.name')
             resolved_config: Configuration being resolved
             original_config: Original configuration for reference
+
+        Returns:
+            Tuple of (whether the value changed, value now at the key path);
+            the value is None if the key path does not exist
         """
         if key_path in self.resolution_cache:
-            return
+            return False, self.resolution_cache[key_path]
 
         if len(self.resolution_stack) >= self.max_depth:
             raise MaxRecursionError(self.max_depth, key_path)
@@ -402,17 +506,22 @@ class ConfigResolver:
             value = self._get_nested_value(resolved_config, key_path)
         except KeyError:
             # Key might not exist in config, skip resolution
-            return
+            return False, None
 
         self.resolution_stack.append(key_path)
 
         try:
             resolved_value = self._resolve_value(value, resolved_config)
+            # Values without references come back as the same object and
+            # need not be written back
+            if resolved_value is value:
+                return False, value
             self._set_nested_value(resolved_config, key_path, resolved_value)
-            self.resolution_cache[key_path] = resolved_value
         finally:
             self.resolution_stack.pop()
 
+        return resolved_value != value, resolved_value
+
     def _resolve_value(self, value: Any, resolved_config: Dict[str, Any]) -> Any:
         """Resolve a single value with its references.
 
@@ -432,18 +541,13 @@ class ConfigResolver:
         elif isinstance(value, list):
             # Recursively resolve list items
             return [self._resolve_value(item, resolved_config) for item in value]
-        elif not isinstance(value, str):
-            return value
-
-        references = self._detect_references(value)
-        if not references:
+        elif not isinstance(value, str) or "{{" not in value:
             return value
 
+        # Cheapest checks first: a pure reference or plain interpolation
+        # needs one regex pass; only the Jinja2 fallback scans for references.
         # Check if this is a pure reference (no additional text or filters)
-        pure_reference_match = re.match(
-            r"^\s*\{\{\s*values\.([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s*\}\}\s*$",
-            value,
-        )
+        pure_reference_match = self.PURE_REFERENCE_PATTERN.match(value)
         if pure_reference_match:
             ref_path = pure_reference_match.group(1).strip()
             try:
@@ -453,9 +557,18 @@ class ConfigResolver:
             except KeyError as e:
                 raise ReferenceResolutionError(f"values.{ref_path}") from e
 
-        # For string interpolation or templates with filters, render as template
+        # Plain references interpolated into text need no template engine
+        substituted = self._substitute_references(value, resolved_config)
+        if substituted is not None:
+            return substituted
+
+        # Template syntax that never mentions values is left as written
+        if not self.REFERENCE_PATTERN.search(value):
+            return value
+
+        # For templates with filters or expressions, render as template
         try:
-            template = self.jinja_env.from_string(value)
+            template = self._compile_template(value)
             return template.render(values=resolved_config)
         except UndefinedError as e:
             # Extract the undefined variable name
@@ -464,6 +577,70 @@ class ConfigResolver:
         except TemplateError as e:
             raise TemplateSyntaxError(value, e) from e
 
+    def _substitute_references(
+        self, value: str, resolved_config: Dict[str, Any]
+    ) -> Optional[str]:
+        """Render a string whose only template syntax is plain references.
+
+        Produces the same output as rendering the string with Jinja2 (values
+        are converted with str(), a single trailing newline of the source is
+        dropped) but with one regex split instead of compiling and running a
+        template.
+
+        Args:
+            value: String containing references
+            resolved_config: Current state of resolved configuration
+
+        Returns:
+            Rendered string, or None if the string uses filters, expressions,
+            other template syntax or references a missing key, in which case
+            it must be rendered by Jinja2
+        """
+        if "{%" in value or "{#" in value or "\r" in value:
+            return None
+
+        # Alternating literal text and reference paths
+        parts = self.SIMPLE_REFERENCE_PATTERN.split(value)
+        if len(parts) // 2 != value.count("{{"):
+            return None
+
+        try:
+            for i in range(1, len(parts), 2):
+                parts[i] = str(self._get_nested_value(resolved_config, parts[i]))
+        except KeyError:
+            return None
+
+        if parts[-1].endswith("\n"):
+            parts[-1] = parts[-1][:-1]
+        return "".join(parts)
+
+    def _compile_template(self, source: str) -> Template:
+        """Compile a template string, reusing earlier compilations.
+
+        Environment.from_string() parses and compiles on every call; configs
+        repeat the same template strings across keys and across resolution
+        passes, so each distinct source is compiled only once per resolver.
+        With the shared environment, compilations are also reused across
+        resolvers, so loading configurations again does not recompile them.
+
+        Args:
+            source: Template source string
+
+        Returns:
+            Compiled Jinja2 template
+
+        Raises:
+            TemplateError: If the template syntax is invalid
+        """
+        template = self.template_cache.get(source)
+        if template is None:
+            if self.jinja_env is _JINJA_ENV:
+                template = _compile_shared(source)
+            else:
+                template = self.jinja_env.from_string(source)
+            self.template_cache[source] = template
+        return template
+
     def _get_nested_value(self, config: Dict[str, Any], key_path: str) -> Any:
         """Get a nested value from configuration using dot notation.
 
@@ -1,8 +1,18 @@
 """File scanning and discovery module."""
 
 import fnmatch
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+# Characters that start a wildcard in fnmatch-style patterns
+_WILDCARD_RE = re.compile(r"[*?[]")
+
+# Extension-only patterns such as "*.py", which match exactly the names
+# ending with the extension
+_SUFFIX_PATTERN_RE = re.compile(r"\*(\.\w+)")
 
 
 class FileScanner:
@@ -29,11 +39,17 @@ class FileScanner:
         "*obj*",  # .NET builds
     }
 
+    # Below this many top-level subdirectories a parallel scan is not worth
+    # the thread pool overhead
+    PARALLEL_MIN_DIRS = 4
+
     def __init__(
         self,
         project_path: Path,
         include_patterns: Optional[List[str]] = None,
         exclude_patterns: Optional[List[str]] = None,
+        parallel: bool = False,
+        workers: Optional[int] = None,
     ):
         """Initialize file scanner.
 
@@ -41,10 +57,31 @@ class FileScanner:
             project_path: Root directory to scan
             include_patterns: File patterns to include (e.g., ["*.py", "*.js"])
             exclude_patterns: Additional patterns to exclude
+            parallel: Walk top-level subdirectories concurrently when there
+                are more than PARALLEL_MIN_DIRS of them
+            workers: Maximum number of walker threads (defaults to the
+                ThreadPoolExecutor default)
         """
         self.project_path = Path(project_path)
         self.include_patterns = include_patterns or ["*"]
         self.exclude_patterns = set(exclude_patterns or []) | self.DEFAULT_EXCLUDES
+        self.parallel = parallel
+        self.workers = workers
+
+        # Wildcard-free excludes are looked up in a set and extension-only
+        # patterns are checked with str.endswith; the rest of each pattern
+        # set is matched with one compiled regex instead of an fnmatch call
+        # per pattern per path
+        self._exclude_names, exclude_rest = _split_literal_patterns(
+            self.exclude_patterns
+        )
+        self._exclude_suffixes, exclude_rest = _split_suffix_patterns(exclude_rest)
+        self._include_suffixes, include_rest = _split_suffix_patterns(
+            self.include_patterns
+        )
+        self._exclude_re = _compile_patterns(exclude_rest)
+        self._include_re = _compile_patterns(include_rest)
+        self._include_prefix = _literal_directory_prefix(self.include_patterns)
 
     def scan(self) -> Iterator[Path]:
         """Scan for processable files.
@@ -58,51 +95,239 @@ class FileScanner:
         if not self.project_path.is_dir():
             raise ValueError(f"Project path is not a directory: {self.project_path}")
 
-        for file_path in self._walk_directory(self.project_path):
-            if self._should_include(file_path):
-                yield file_path
+        root = os.fspath(self.project_path)
+        if self._include_prefix:
+            # Only files below the include pattern's literal directory can
+            # match, so start the walk there instead of at the project root
+            yield from self._scan_prefix(root, self._include_prefix)
+        elif self.parallel:
+            yield from self._scan_parallel(root)
+        else:
+            yield from self._matching_files(root, "")
+
+    def _scan_prefix(self, root: str, components: List[str]) -> Iterator[Path]:
+        """Scan only the subtree at a relative directory below the root."""
+        prefix = ""
+        for component in components:
+            prefix += component
+            if self._is_excluded_directory(prefix, component):
+                return
+            prefix += os.sep
+
+        start = os.path.join(root, *components)
+        if os.path.isdir(start):
+            yield from self._matching_files(start, prefix)
+
+    def _scan_parallel(self, root: str) -> Iterator[Path]:
+        """Scan with each top-level subdirectory walked in its own task.
+
+        Directory listing is dominated by system calls that release the GIL,
+        so separate subtrees can be walked concurrently by threads. Results
+        are yielded in directory listing order: files at the root first,
+        then each subtree in turn.
+        """
+        try:
+            with os.scandir(root) as entries:
+                top_level = list(entries)
+        except PermissionError:
+            return
+
+        subdirectories = [
+            entry
+            for entry in top_level
+            if entry.is_dir()
+            and not self._is_excluded_directory(entry.name, entry.name)
+        ]
+        if len(subdirectories) <= self.PARALLEL_MIN_DIRS:
+            yield from self._matching_files(root, "")
+            return
+
+        for entry in top_level:
+            if entry.is_file() and self._should_include(entry.name, entry.name):
+                yield Path(entry.path)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self._collect_files, entry.path, entry.name + os.sep)
+                for entry in subdirectories
+            ]
+            for future in futures:
+                yield from future.result()
+
+    def _collect_files(self, directory: str, prefix: str) -> List[Path]:
+        """Collect a subtree's matching files in one list for a worker thread."""
+        return list(self._matching_files(directory, prefix))
+
+    def _matching_files(self, directory: str, prefix: str) -> Iterator[Path]:
+        """Yield files below a directory that pass the include/exclude patterns."""
+        for entry, relative_path in self._walk_directory(directory, prefix):
+            if self._should_include(relative_path, entry.name):
+                yield Path(entry.path)
+
+    def _walk_directory(
+        self, directory: str, prefix: str
+    ) -> Iterator[Tuple["os.DirEntry[str]", str]]:
+        """Recursively walk directory tree, pruning excluded directories.
 
-    def _walk_directory(self, directory: Path) -> Iterator[Path]:
-        """Recursively walk directory tree."""
+        Entries come from os.scandir, whose file/directory checks reuse the
+        type information returned with the directory listing instead of
+        stat()ing every path. Excluded directories are skipped before they
+        are opened, so nothing below them is ever listed.
+
+        Args:
+            directory: Directory to list
+            prefix: Path of ``directory`` relative to the project root,
+                ending with a separator (empty for the root itself)
+
+        Yields:
+            Tuples of (directory entry, path relative to the project root)
+            for every file found
+        """
         try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    yield item
-                elif item.is_dir() and not self._is_excluded_directory(item):
-                    yield from self._walk_directory(item)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = prefix + entry.name
+                    if entry.is_file():
+                        yield entry, relative_path
+                    elif entry.is_dir() and not self._is_excluded_directory(
+                        relative_path, entry.name
+                    ):
+                        yield from self._walk_directory(
+                            entry.path, relative_path + os.sep
+                        )
         except PermissionError:
             # Skip directories we can't read
             pass
 
-    def _should_include(self, file_path: Path) -> bool:
+    def _should_include(self, path_str: str, file_name: str) -> bool:
         """Check if file should be included based on patterns."""
-        relative_path = file_path.relative_to(self.project_path)
-        path_str = str(relative_path)
+        path_str = os.path.normcase(path_str)
+        file_name = os.path.normcase(file_name)
 
-        # Check exclusion patterns first
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(
-                file_path.name, pattern
-            ):
-                return False
+        # Check exclusion patterns first. The file name ends the relative
+        # path, so a suffix check on the name covers both.
+        if self._is_literally_excluded(path_str, file_name):
+            return False
+        if file_name.endswith(self._exclude_suffixes):
+            return False
+        excluded = self._exclude_re
+        if excluded and (excluded.match(path_str) or excluded.match(file_name)):
+            return False
 
         # Check inclusion patterns
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(
-                file_path.name, pattern
-            ):
-                return True
+        if file_name.endswith(self._include_suffixes):
+            return True
+        included = self._include_re
+        return bool(
+            included and (included.match(path_str) or included.match(file_name))
+        )
 
-        return False
-
-    def _is_excluded_directory(self, directory: Path) -> bool:
+    def _is_excluded_directory(self, path_str: str, dir_name: str) -> bool:
         """Check if directory should be excluded from traversal."""
-        dir_name = directory.name
-        relative_path = directory.relative_to(self.project_path)
-        path_str = str(relative_path)
+        path_str = os.path.normcase(path_str)
+        dir_name = os.path.normcase(dir_name)
+        if self._is_literally_excluded(path_str, dir_name):
+            return True
+        if dir_name.endswith(self._exclude_suffixes):
+            return True
+        excluded = self._exclude_re
+        return bool(excluded and (excluded.match(path_str) or excluded.match(dir_name)))
+
+    def _is_literally_excluded(self, path_str: str, name: str) -> bool:
+        """Check normcased paths against the wildcard-free exclude patterns."""
+        names = self._exclude_names
+        return bool(names) and (name in names or path_str in names)
+
+
+def _split_literal_patterns(
+    patterns: Iterable[str],
+) -> Tuple[FrozenSet[str], List[str]]:
+    """Separate wildcard-free patterns from the other glob patterns.
+
+    A pattern without wildcards matches only the identical string, which a
+    set lookup checks without the regex engine.
+
+    Args:
+        patterns: Shell-style glob patterns
+
+    Returns:
+        Tuple of (normcased literal patterns, remaining patterns)
+    """
+    literals = set()
+    rest = []
+    for pattern in patterns:
+        if _WILDCARD_RE.search(pattern):
+            rest.append(pattern)
+        else:
+            literals.add(os.path.normcase(pattern))
+    return frozenset(literals), rest
+
+
+def _split_suffix_patterns(
+    patterns: Iterable[str],
+) -> Tuple[Tuple[str, ...], List[str]]:
+    """Separate extension-only patterns from the other glob patterns.
+
+    A pattern such as "*.py" matches a path exactly when the path ends with
+    ".py", which str.endswith checks without the regex engine.
+
+    Args:
+        patterns: Shell-style glob patterns
+
+    Returns:
+        Tuple of (normcased suffixes, remaining patterns)
+    """
+    suffixes = []
+    rest = []
+    for pattern in patterns:
+        match = _SUFFIX_PATTERN_RE.fullmatch(os.path.normcase(pattern))
+        if match:
+            suffixes.append(match.group(1))
+        else:
+            rest.append(pattern)
+    return tuple(sorted(suffixes)), rest
+
+
+def _compile_patterns(patterns: Iterable[str]) -> "Optional[re.Pattern[str]]":
+    """Combine glob patterns into one regex matching any of them.
+
+    Matches exactly what fnmatch.fnmatch() would for each pattern
+    separately, given paths passed through os.path.normcase().
+
+    Args:
+        patterns: Shell-style glob patterns
+
+    Returns:
+        Compiled regex, or None if there are no patterns
+    """
+    alternatives = [
+        fnmatch.translate(os.path.normcase(pattern)) for pattern in sorted(patterns)
+    ]
+    return re.compile("|".join(alternatives)) if alternatives else None
+
+
+def _literal_directory_prefix(patterns: List[str]) -> List[str]:
+    """Find the directory every include match must lie under, if any.
+
+    A pattern containing a path separator can only match relative paths,
+    never bare file names, so with a single pattern such as "src/app/*.py"
+    every match is below "src/app". Only whole directory components before
+    the first wildcard count.
+
+    Args:
+        patterns: Include patterns
 
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(dir_name, pattern):
-                return True
+    Returns:
+        Directory components of the literal prefix, or an empty list when
+        the walk has to start at the project root
+    """
+    if len(patterns) != 1:
+        return []
 
-        return False
+    # normcase turns "/" into the native separator where they differ
+    pattern = os.path.normcase(patterns[0])
+    head = _WILDCARD_RE.split(pattern, maxsplit=1)[0]
+    components = head.split(os.sep)[:-1]
+    if not components or any(c in ("", ".", "..") for c in components):
+        return []
+    return components
@@ -1,13 +1,22 @@
 """File writing and backup module."""
 
+import re
 import shutil
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, NamedTuple
 
+from ..utils.io import read_lines
 from .parser import TemplateMarker
 
 
+@lru_cache(maxsize=256)
+def _assignment_pattern(variable_name: str) -> "re.Pattern[str]":
+    """Compile the pattern matching an assignment to a variable, once per name."""
+    return re.compile(rf"({re.escape(variable_name)}\s*=\s*)[^#\n]*")
+
+
 class FileChange(NamedTuple):
     """Represents a change to be made to a file."""
 
@@ -43,12 +52,12 @@ class FileWriter:
         Returns:
             List of FileChange objects representing planned modifications
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File does not exist: {file_path}")
-
+        # Scanned files are known to exist, so the file is opened directly
+        # rather than stat()ed first
         try:
-            with open(file_path, encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = read_lines(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File does not exist: {file_path}") from None
         except UnicodeDecodeError as e:
             raise ValueError(f"Cannot read file as text: {file_path}") from e
 
@@ -166,8 +175,7 @@ class FileWriter:
             self.create_backup(file_path)
 
         # Read current file content
-        with open(file_path, encoding="utf-8") as f:
-            lines = f.readlines()
+        lines = read_lines(file_path)
 
         # Apply changes (in reverse order to maintain line numbers)
         for change in sorted(changes, key=lambda c: c.line_number, reverse=True):
@@ -194,15 +202,10 @@ class FileWriter:
         # Simple approach: look for variable_name = and replace everything after =
         # This could be made more sophisticated to handle various assignment patterns
 
-        import re
-
-        # Pattern to match variable assignment
-        pattern = rf"({re.escape(variable_name)}\s*=\s*)[^#\n]*"
-
         def replace_value(match):
             return f"{match.group(1)}{new_value}"
 
-        new_line = re.sub(pattern, replace_value, old_line)
+        new_line = _assignment_pattern(variable_name).sub(replace_value, old_line)
 
         # If no substitution was made, append the assignment
         if new_line == old_line:
@@ -1,7 +1,34 @@
 """File type detection and comment syntax mapping."""
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Optional, Union
+
+# Number of leading bytes inspected by content-based detection
+CONTENT_SNIFF_SIZE = 512
+
+# Filename families that FILENAME_PATTERNS can only list one by one
+# (e.g. any ``.env.*`` or ``requirements*.txt``), compiled once at import into
+# a single alternation whose group names are the comment types. Names are
+# matched after lowercasing.
+_FILENAME_FAMILY_RE = re.compile(
+    r"(?P<hash>"
+    r"(?:docker|make|rake)file"
+    r"|(?:gem|pip)file(?:\.lock)?"
+    r"|\.env(?:\..+)?"
+    r"|requirements(?:[-_.].+)?\.txt"
+    r"|\.(?:git|docker)ignore"
+    r"|(?:cargo|poetry)\.lock"
+    r"|(?:cargo|pyproject)\.toml"
+    r")"
+    r"|(?P<double_slash>go\.(?:mod|sum))"
+)
+
+# Language keywords used by content-based detection
+_PY_KEYWORDS_RE = re.compile(rb"import |from |def |class ")
+_JS_KEYWORDS_RE = re.compile(rb"const |let |var |function")
 
 
 class FileTypeDetector:
@@ -75,6 +102,38 @@ class FileTypeDetector:
         ".jsonc": "double_slash",
     }
 
+    # Comment syntax details per comment type, shared by get_comment_syntax_info()
+    COMMENT_SYNTAX_INFO: Dict[str, Dict[str, str]] = {
+        "hash": {
+            "single_line": "#",
+            "example": "# variable = {{ expression }}",
+            "description": "Hash comments (Python, Shell, YAML)",
+        },
+        "double_slash": {
+            "single_line": "//",
+            "example": "// variable = {{ expression }}",
+            "description": "Double slash comments (JavaScript, Java, C++)",
+        },
+        "css": {
+            "single_line": "/* */",
+            "example": "/* variable = {{ expression }} */",
+            "description": "CSS-style comments",
+        },
+        "html": {
+            "single_line": "<!-- -->",
+            "example": "<!-- variable = {{ expression }} -->",
+            "description": "HTML/XML comments",
+        },
+        "double_dash": {
+            "single_line": "--",
+            "example": "-- variable = {{ expression }}",
+            "description": "Double dash comments (SQL, Lua)",
+        },
+    }
+
+    # Built once at class creation; returned as-is by get_supported_extensions()
+    _SUPPORTED_EXTENSIONS: FrozenSet[str] = frozenset(EXTENSION_MAP)
+
     # Special filename patterns (all lowercase for case-insensitive matching)
     FILENAME_PATTERNS = {
         "dockerfile": "hash",
@@ -106,92 +165,105 @@ class FileTypeDetector:
         """Initialize file type detector."""
         pass
 
-    def detect_comment_type(self, file_path: Path) -> Optional[str]:
+    def detect_comment_type(
+        self, file_path: Union[str, "os.PathLike[str]"]
+    ) -> Optional[str]:
         """Detect the appropriate comment syntax for a file.
 
         Args:
-            file_path: Path to file
+            file_path: Path to file (``Path`` or plain string)
 
         Returns:
             Comment type string ('hash', 'double_slash', 'css', 'html', 'double_dash')
             or None if not supported
         """
-        file_path = Path(file_path)
-
-        # Check special filename patterns first
-        filename = file_path.name.lower()
-        if filename in self.FILENAME_PATTERNS:
-            return self.FILENAME_PATTERNS[filename]
-
-        # Check by file extension
-        suffix = file_path.suffix.lower()
-        if suffix in self.EXTENSION_MAP:
-            return self.EXTENSION_MAP[suffix]
-
-        # Handle files with multiple extensions (e.g., .env.local, config.yml)
-        if len(file_path.suffixes) > 1:
-            # Check if any part of the filename indicates the file type
-            name_parts = file_path.name.lower().split(".")
-
-            # Look for environment files pattern
-            if any(part in name_parts for part in ["env", "environment"]):
-                return "hash"
-
-            # Check each suffix
-            for suffix in file_path.suffixes:
-                if suffix.lower() in self.EXTENSION_MAP:
-                    return self.EXTENSION_MAP[suffix.lower()]
+        # Split the name with C-level str methods only: no pathlib object and
+        # no os.path helper calls on this per-file hot path. Separators follow
+        # the platform (backslash is only one on Windows).
+        path_str = os.fspath(file_path)
+        filename = path_str.rpartition(os.sep)[2]
+        if os.altsep:
+            filename = filename.rpartition(os.altsep)[2]
+        filename = filename.lower()
+
+        # Same rules as PurePath.suffix: a leading or trailing dot is no suffix
+        dot = filename.rfind(".")
+        suffix = filename[dot:] if 0 < dot < len(filename) - 1 else ""
+
+        # Name-based lookup never touches the filesystem. A file that has an
+        # extension is decided here, recognized or not, so no stat/open
+        # happens for it.
+        comment_type = _lookup_by_name(filename, suffix)
+        if comment_type is not None or suffix:
+            return comment_type
 
         # Try content-based detection for files without extensions
-        if not file_path.suffix and file_path.exists():
-            return self._detect_by_content(file_path)
-
-        return None
+        return self._detect_by_content(path_str)
 
-    def _detect_by_content(self, file_path: Path) -> Optional[str]:
+    def _detect_by_content(
+        self, file_path: Union[str, "os.PathLike[str]"]
+    ) -> Optional[str]:
         """Detect comment type by examining file content.
 
+        The file is opened directly (EAFP) instead of checking for existence
+        first; missing, unreadable or directory paths simply yield None.
+
         Args:
             file_path: Path to file to examine
 
         Returns:
             Comment type if detected, None otherwise
         """
+        path_str = os.fspath(file_path)
+        try:
+            fd = os.open(path_str, os.O_RDONLY)
+        except OSError:
+            return None
+
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                # Read first few lines to detect shebang or content patterns
-                first_lines = []
-                for i, line in enumerate(f):
-                    if i >= 5:  # Only check first 5 lines
-                        break
-                    first_lines.append(line.strip())
-
-                # Check for shebang patterns
-                if first_lines and first_lines[0].startswith("#!"):
-                    shebang = first_lines[0].lower()
-                    if any(shell in shebang for shell in ["bash", "sh", "zsh", "fish"]):
-                        return "hash"
-                    elif "python" in shebang:
-                        return "hash"
-                    elif "node" in shebang or "bun" in shebang:
-                        return "double_slash"
-
-                # Check for common file patterns
-                content = " ".join(first_lines).lower()
-                if any(
-                    keyword in content
-                    for keyword in ["import ", "from ", "def ", "class "]
-                ):
-                    return "hash"  # Likely Python
-                elif any(
-                    keyword in content
-                    for keyword in ["const ", "let ", "var ", "function"]
-                ):
-                    return "double_slash"  # Likely JavaScript
-
-        except (OSError, UnicodeDecodeError):
-            # Skip binary files or files we can't read
-            pass
+            # One bounded read of the prefix; empty files need no read at all
+            # since fstat already gave us the size
+            size = min(os.fstat(fd).st_size, CONTENT_SNIFF_SIZE)
+            head = os.read(fd, size) if size else b""
+            return self._classify_content(head)
+        except OSError:
+            # Skip files we can't read (e.g. directories)
+            return None
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _classify_content(head: bytes) -> Optional[str]:
+        """Classify the leading bytes of a file by shebang or language keywords.
+
+        Args:
+            head: First CONTENT_SNIFF_SIZE bytes of the file
+
+        Returns:
+            Comment type if detected, None otherwise
+        """
+        # A NUL byte means binary data; bail out before any keyword scanning
+        if b"\x00" in head:
+            return None
+
+        # Check for shebang patterns on raw bytes; no decode is needed
+        if head.startswith(b"#!"):
+            end = head.find(b"\n")
+            shebang = head[2 : end if end != -1 else len(head)].lower()
+            if any(shell in shebang for shell in (b"bash", b"sh", b"zsh", b"fish")):
+                return "hash"
+            elif b"python" in shebang:
+                return "hash"
+            elif b"node" in shebang or b"bun" in shebang:
+                return "double_slash"
+
+        # Check for common file patterns in the first few lines, one regex
+        # pass per language
+        content = b" ".join(line.strip() for line in head.splitlines()[:5]).lower()
+        if _PY_KEYWORDS_RE.search(content):
+            return "hash"  # Likely Python
+        elif _JS_KEYWORDS_RE.search(content):
+            return "double_slash"  # Likely JavaScript
 
         return None
 
@@ -206,13 +278,13 @@ class FileTypeDetector:
         """
         return self.detect_comment_type(file_path) is not None
 
-    def get_supported_extensions(self) -> List[str]:
-        """Get list of all supported file extensions.
+    def get_supported_extensions(self) -> FrozenSet[str]:
+        """Get all supported file extensions.
 
         Returns:
-            List of supported file extensions
+            Immutable set of supported file extensions
         """
-        return list(self.EXTENSION_MAP.keys())
+        return self._SUPPORTED_EXTENSIONS
 
     def get_comment_syntax_info(self, comment_type: str) -> Dict[str, str]:
         """Get comment syntax information for a comment type.
@@ -221,34 +293,59 @@ class FileTypeDetector:
             comment_type: Type of comment ('hash', 'double_slash', etc.)
 
         Returns:
-            Dictionary with comment syntax information
+            Dictionary with comment syntax information. The dictionary is
+            shared between calls and must not be modified.
         """
-        syntax_info = {
-            "hash": {
-                "single_line": "#",
-                "example": "# variable = {{ expression }}",
-                "description": "Hash comments (Python, Shell, YAML)",
-            },
-            "double_slash": {
-                "single_line": "//",
-                "example": "// variable = {{ expression }}",
-                "description": "Double slash comments (JavaScript, Java, C++)",
-            },
-            "css": {
-                "single_line": "/* */",
-                "example": "/* variable = {{ expression }} */",
-                "description": "CSS-style comments",
-            },
-            "html": {
-                "single_line": "<!-- -->",
-                "example": "<!-- variable = {{ expression }} -->",
-                "description": "HTML/XML comments",
-            },
-            "double_dash": {
-                "single_line": "--",
-                "example": "-- variable = {{ expression }}",
-                "description": "Double dash comments (SQL, Lua)",
-            },
-        }
-
-        return syntax_info.get(comment_type, {})
+        return self.COMMENT_SYNTAX_INFO.get(comment_type, {})
+
+
+@lru_cache(maxsize=4096)
+def _lookup_by_name(filename: str, suffix: str) -> Optional[str]:
+    """Map a lowercased file name and suffix to a comment type.
+
+    Pure function of its arguments, so results are memoized across calls.
+    Both arguments are lowercased once by the caller, so every check below
+    is a plain hashed lookup with no further case folding.
+
+    Args:
+        filename: Lowercased base name of the file
+        suffix: Lowercased final suffix (e.g. ".py"), or "" if none
+
+    Returns:
+        Comment type string or None if the name alone is not conclusive
+    """
+    # Check special filename patterns first
+    comment_type = FileTypeDetector.FILENAME_PATTERNS.get(filename)
+    if comment_type is not None:
+        return comment_type
+
+    # Check by file extension (same rules as PurePath.suffix)
+    comment_type = FileTypeDetector.EXTENSION_MAP.get(suffix)
+    if comment_type is not None:
+        return comment_type
+
+    # Handle files with multiple extensions (e.g., .env.local, config.yml)
+    # Like PurePath.suffixes, leading dots belong to the stem: ".py.foo.bar"
+    # has the suffixes ".foo" and ".bar"
+    suffix_parts = filename.lstrip(".").split(".")[1:]
+    if suffix and len(suffix_parts) > 1:
+        # Check if any part of the filename indicates the file type
+        name_parts = filename.split(".")
+
+        # Look for environment files pattern
+        if any(part in name_parts for part in ["env", "environment"]):
+            return "hash"
+
+        # Check each suffix
+        for part in suffix_parts:
+            comment_type = FileTypeDetector.EXTENSION_MAP.get("." + part)
+            if comment_type is not None:
+                return comment_type
+
+    # Filename families only decide names that no extension identifies, so
+    # e.g. ".env.json" keeps the JSON comment syntax
+    match = _FILENAME_FAMILY_RE.fullmatch(filename)
+    if match is not None:
+        return match.lastgroup
+
+    return None
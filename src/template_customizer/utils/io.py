@@ -0,0 +1,57 @@
+"""File reading helpers."""
+
+import io
+import os
+from typing import List, Union
+
+# Files below this size are read with a single os.read and decoded in one go
+SMALL_FILE_SIZE = 64 * 1024
+
+# Smallest read request; files that report a size of 0 (procfs, pipes) or
+# that keep growing are still read in reasonably sized chunks
+_MIN_READ_SIZE = 8192
+
+
+def _read_small(fd: int, size: int) -> bytes:
+    """Read a file of known size from an open descriptor."""
+    # Ask for more than expected so a file that grew since fstat is still
+    # read to the end without one syscall per byte
+    read_size = max(size + 1, _MIN_READ_SIZE)
+    chunks = []
+    while True:
+        chunk = os.read(fd, read_size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def read_lines(file_path: Union[str, "os.PathLike[str]"]) -> List[str]:
+    """Read a UTF-8 text file as a list of lines.
+
+    Equivalent to ``open(file_path, encoding="utf-8").readlines()``, including
+    universal newline translation. Small files skip the buffered text layer:
+    they are read with one os.read and decoded in one step.
+
+    Args:
+        file_path: Path to file to read
+
+    Returns:
+        Lines of the file, each keeping its trailing newline
+
+    Raises:
+        OSError: If the file cannot be opened or read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    fd = os.open(os.fspath(file_path), os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < SMALL_FILE_SIZE:
+            data = _read_small(fd, size)
+        else:
+            with open(fd, encoding="utf-8", closefd=False) as f:
+                return f.readlines()
+    finally:
+        os.close(fd)
+
+    return io.StringIO(data.decode("utf-8"), newline=None).readlines()
@@ -6,6 +6,12 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import Template, TemplateError
 
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+_VARIABLE_REFERENCE_RE = re.compile(
+    r"values\.([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)"
+)
+
 
 class ParameterValidator:
     """Validates configuration parameters."""
@@ -49,7 +55,7 @@ class ParameterValidator:
                         continue
 
                     # Check key naming
-                    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", key):
+                    if not _IDENTIFIER_RE.match(key):
                         errors.append(
                             f"Invalid parameter name '{current_path}': "
                             f"must be valid identifier"
@@ -102,11 +108,7 @@ class TemplateValidator:
             Error message if invalid references found, None if valid
         """
         # Extract variable references from expression
-        variable_pattern = re.compile(
-            r"values\.([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)"
-        )
-
-        matches = variable_pattern.findall(expression)
+        matches = _VARIABLE_REFERENCE_RE.findall(expression)
 
         for var_path in matches:
             if not self._check_variable_exists(var_path, available_variables):
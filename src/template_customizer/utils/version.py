@@ -1,19 +1,63 @@
 """Version management utilities for template customizer."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, total_ordering
 from typing import Any, Optional, Tuple
 
+# Semantic version string (semver.org 2.0.0), compiled once at import
+_SEMVER_RE = re.compile(
+    r"^(?P<major>0|[1-9]\d*)"
+    r"\.(?P<minor>0|[1-9]\d*)"
+    r"\.(?P<patch>0|[1-9]\d*)"
+    r"(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z][0-9a-zA-Z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z][0-9a-zA-Z-]*))*))"
+    r"?(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
+)
 
-@dataclass
+
+def _could_be_version(version_string: str) -> bool:
+    """Cheap check that rejects most invalid strings before the regex runs.
+
+    Every semantic version starts with a digit and has at least two dots.
+    """
+    return (
+        version_string[:1].isdigit()
+        and version_string.count(".") >= 2
+        and not version_string.endswith(("-", "+"))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _prerelease_identifiers(prerelease: str) -> Tuple[Tuple[int, Any], ...]:
+    """Split a prerelease into identifiers that compare by semver precedence.
+
+    Numeric identifiers compare as integers and sort before alphanumeric
+    ones, which compare lexically. Cached, so repeated comparisons of the
+    same prereleases do not split them again.
+    """
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in prerelease.split(".")
+    )
+
+
+@total_ordering
+@dataclass(frozen=True)
 class SemanticVersion:
-    """Semantic version representation following semver.org specification."""
+    """Semantic version representation following semver.org specification.
+
+    Instances are immutable, so parsed versions can be cached and shared.
+    Equality and hashing are generated from the precedence fields; ordering
+    is derived from __lt__.
+    """
 
     major: int
     minor: int
     patch: int
     prerelease: Optional[str] = None
-    build: Optional[str] = None
+    # Build metadata does not take part in version precedence
+    build: Optional[str] = field(default=None, compare=False)
 
     def __str__(self) -> str:
         """Return string representation of version."""
@@ -24,49 +68,26 @@ class SemanticVersion:
             version += f"+{self.build}"
         return version
 
-    def __eq__(self, other: Any) -> bool:
-        """Check if two versions are equal."""
-        if not isinstance(other, SemanticVersion):
-            return False
-        return (
-            self.major == other.major
-            and self.minor == other.minor
-            and self.patch == other.patch
-            and self.prerelease == other.prerelease
-        )
-
     def __lt__(self, other: Any) -> bool:
-        """Check if this version is less than another."""
+        """Check if this version is less than another.
+
+        A normal version sorts after its prereleases (semver.org, item 11).
+        """
         if not isinstance(other, SemanticVersion):
             return NotImplemented
+        return self._precedence_key() < other._precedence_key()
 
-        # Compare major.minor.patch
-        self_version = (self.major, self.minor, self.patch)
-        other_version = (other.major, other.minor, other.patch)
-        if self_version != other_version:
-            return self_version < other_version
-
-        # Handle prerelease versions
-        if self.prerelease is None and other.prerelease is None:
-            return False
+    def _precedence_key(self) -> Tuple[Any, ...]:
+        """Key that orders versions by semver precedence."""
         if self.prerelease is None:
-            return False  # Normal version > prerelease
-        if other.prerelease is None:
-            return True  # Prerelease < normal version
-
-        return self.prerelease < other.prerelease
-
-    def __le__(self, other: Any) -> bool:
-        """Check if this version is less than or equal to another."""
-        return self == other or self < other
-
-    def __gt__(self, other: Any) -> bool:
-        """Check if this version is greater than another."""
-        return not self <= other
-
-    def __ge__(self, other: Any) -> bool:
-        """Check if this version is greater than or equal to another."""
-        return not self < other
+            return (self.major, self.minor, self.patch, True, ())
+        return (
+            self.major,
+            self.minor,
+            self.patch,
+            False,
+            _prerelease_identifiers(self.prerelease),
+        )
 
     def is_compatible_with(self, other: "SemanticVersion") -> bool:
         """Check if this version is compatible with another (same major version)."""
@@ -99,19 +120,17 @@ class VersionParser:
     """Parser for semantic version strings."""
 
     # Regex pattern for semantic versioning (simplified)
-    VERSION_PATTERN = re.compile(
-        r"^(?P<major>0|[1-9]\d*)"
-        r"\.(?P<minor>0|[1-9]\d*)"
-        r"\.(?P<patch>0|[1-9]\d*)"
-        r"(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z][0-9a-zA-Z-]*)"
-        r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z][0-9a-zA-Z-]*))*))"
-        r"?(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-    )
+    VERSION_PATTERN = _SEMVER_RE
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def parse(cls, version_string: str) -> SemanticVersion:
         """Parse a version string into a SemanticVersion object.
 
+        Results are cached: the same few version strings (package and
+        configuration versions) are parsed over and over, and the returned
+        versions are immutable so they can be shared.
+
         Args:
             version_string: Version string to parse (e.g., "1.2.3", "1.0.0-alpha.1")
 
@@ -124,12 +143,7 @@ class VersionParser:
         version_string = version_string.strip()
 
         # Additional validation for common invalid patterns
-        if (
-            version_string.endswith("-")
-            or version_string.endswith("+")
-            or version_string.startswith("v")
-            or not version_string
-        ):
+        if not _could_be_version(version_string):
             raise ValueError(f"Invalid version string: {version_string}")
 
         match = cls.VERSION_PATTERN.match(version_string)
@@ -156,6 +170,8 @@ class VersionParser:
         Returns:
             True if valid, False otherwise
         """
+        if not _could_be_version(version_string.strip()):
+            return False
         try:
             cls.parse(version_string)
             return True
@@ -239,9 +255,12 @@ class VersionManager:
         return str(next_version)
 
 
+@lru_cache(maxsize=None)
 def get_version_info() -> Tuple[str, SemanticVersion]:
     """Get current version information from package.
 
+    The result is cached; both elements are immutable.
+
     Returns:
         Tuple of (version_string, SemanticVersion_object)
     """
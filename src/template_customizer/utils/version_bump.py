@@ -6,6 +6,23 @@ from typing import List, Optional, Tuple
 
 from .version import VersionManager, VersionParser
 
+# __version__ = "x.y.z" assignment, with the quotes captured around the version
+_INIT_VERSION_RE = re.compile(r'(__version__\s*=\s*["\'])([^"\']+)(["\'])')
+
+# Static version = "x.y.z" entry in pyproject.toml
+_PYPROJECT_VERSION_RE = re.compile(r'(version\s*=\s*["\'])([^"\']+)(["\'])')
+
+# Customizer-specific version fields in a configuration file, most specific
+# first; project versions are not matched
+_CONFIG_VERSION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r'customizer[_-]?version\s*:\s*["\']?([^"\'\\s]+)["\']?',
+        r'tool[_-]?version\s*:\s*["\']?([^"\'\\s]+)["\']?',
+        r'^version\s*:\s*["\']?([^"\'\\s]+)["\']?',  # Match at line start
+    )
+)
+
 
 class VersionBumper:
     """Utility for bumping version numbers in source files."""
@@ -38,13 +55,12 @@ class VersionBumper:
         content = self.init_file.read_text(encoding="utf-8")
 
         # Look for __version__ = "x.y.z" pattern
-        version_pattern = r'__version__\s*=\s*["\']([^"\']+)["\']'
-        match = re.search(version_pattern, content)
+        match = _INIT_VERSION_RE.search(content)
 
         if not match:
             raise ValueError("Version not found in __init__.py")
 
-        return match.group(1)
+        return match.group(2)
 
     def bump_version(self, bump_type: str, dry_run: bool = False) -> str:
         """Bump version in project files.
@@ -78,8 +94,7 @@ class VersionBumper:
         content = self.init_file.read_text(encoding="utf-8")
 
         # Replace __version__ = "old_version" with __version__ = "new_version"
-        version_pattern = r'(__version__\s*=\s*["\'])([^"\']+)(["\'])'
-        updated_content = re.sub(version_pattern, f"\\g<1>{new_version}\\g<3>", content)
+        updated_content = _INIT_VERSION_RE.sub(f"\\g<1>{new_version}\\g<3>", content)
 
         self.init_file.write_text(updated_content, encoding="utf-8")
 
@@ -95,10 +110,9 @@ class VersionBumper:
         content = self.pyproject_file.read_text(encoding="utf-8")
 
         # Only update if there's a static version (not dynamic)
-        version_pattern = r'(version\s*=\s*["\'])([^"\']+)(["\'])'
-        if re.search(version_pattern, content):
-            updated_content = re.sub(
-                version_pattern, f"\\g<1>{new_version}\\g<3>", content
+        if _PYPROJECT_VERSION_RE.search(content):
+            updated_content = _PYPROJECT_VERSION_RE.sub(
+                f"\\g<1>{new_version}\\g<3>", content
             )
             self.pyproject_file.write_text(updated_content, encoding="utf-8")
 
@@ -116,6 +130,29 @@ class VersionCompatibilityChecker:
             config_path: Path to configuration file
             tool_version: Current tool version string
 
+        Returns:
+            Tuple of (is_compatible, warning_message)
+        """
+        try:
+            config_content = config_path.read_text(encoding="utf-8")
+        except Exception:
+            # If we can't read the file, assume it's fine
+            return True, None
+
+        return VersionCompatibilityChecker._check_config_text(
+            config_content, tool_version
+        )
+
+    @staticmethod
+    def _check_config_text(
+        config_content: str, tool_version: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Check configuration text for compatibility with tool version.
+
+        Args:
+            config_content: Configuration file content
+            tool_version: Current tool version string
+
         Returns:
             Tuple of (is_compatible, warning_message)
         """
@@ -126,20 +163,10 @@ class VersionCompatibilityChecker:
             # Parse the tool version
             tool_version_obj = VersionParser.parse(tool_version)
 
-            # Read config file to look for version info
-            config_content = config_path.read_text(encoding="utf-8")
-
             # Look for version information in config
-            # Only match customizer-specific version fields, not project versions
-            version_patterns = [
-                r'customizer[_-]?version\s*:\s*["\']?([^"\'\\s]+)["\']?',
-                r'tool[_-]?version\s*:\s*["\']?([^"\'\\s]+)["\']?',
-                r'^version\s*:\s*["\']?([^"\'\\s]+)["\']?',  # Match at line start
-            ]
-
             config_version = None
-            for pattern in version_patterns:
-                match = re.search(pattern, config_content, re.IGNORECASE | re.MULTILINE)
+            for pattern in _CONFIG_VERSION_RES:
+                match = pattern.search(config_content)
                 if match:
                     try:
                         config_version = VersionParser.parse(match.group(1))
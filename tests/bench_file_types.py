@@ -0,0 +1,89 @@
+"""Micro-benchmarks for file type detection.
+
+Not collected by the default test run (see ``python_files`` in pyproject.toml).
+Run explicitly with pytest-benchmark installed:
+
+    pytest tests/bench_file_types.py --benchmark-group-by=group
+
+Groups map to the two kinds of hot path in FileTypeDetector:
+
+- ``extension_hit`` / ``filename_hit``: name-based lookup, compute-bound
+  (string slicing, dict and regex lookups, no filesystem access)
+- ``shebang`` / ``keywords`` / ``binary``: content-based detection, I/O-bound
+  (open + fstat + one bounded read per file)
+"""
+
+from pathlib import Path
+
+import pytest
+
+from template_customizer.utils.file_types import FileTypeDetector
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def content_files(temp_dir):
+    """Extensionless files that force content-based detection."""
+    files = {
+        "shebang": temp_dir / "script",
+        "keywords": temp_dir / "module",
+        "binary": temp_dir / "blob",
+    }
+    files["shebang"].write_text("#!/usr/bin/env python3\nprint('hello')\n")
+    files["keywords"].write_text("import os\nfrom pathlib import Path\n")
+    files["binary"].write_bytes(b"\x7fELF\x02\x01\x01\x00" + bytes(256))
+    return files
+
+
+@pytest.mark.benchmark(group="extension_hit")
+def test_bench_extension_hit(benchmark, detector):
+    """Known extension, repeated path (lookup cache hit)."""
+    assert benchmark(detector.detect_comment_type, Path("src/app/module.py")) == "hash"
+
+
+@pytest.mark.benchmark(group="extension_hit")
+def test_bench_extension_hit_unique_names(benchmark, detector):
+    """Known extension over many distinct names (lookup cache misses)."""
+    paths = [f"src/pkg_{i // 50}/module_{i}.py" for i in range(1000)]
+
+    def detect_all():
+        return [detector.detect_comment_type(p) for p in paths]
+
+    assert set(benchmark(detect_all)) == {"hash"}
+
+
+@pytest.mark.benchmark(group="filename_hit")
+def test_bench_filename_hit(benchmark, detector):
+    """Special filename from FILENAME_PATTERNS."""
+    assert benchmark(detector.detect_comment_type, Path("docker/Dockerfile")) == "hash"
+
+
+@pytest.mark.benchmark(group="filename_hit")
+def test_bench_filename_family_hit(benchmark, detector):
+    """Special filename matched by the filename family regex."""
+    assert benchmark(detector.detect_comment_type, Path(".env.staging")) == "hash"
+
+
+@pytest.mark.benchmark(group="shebang")
+def test_bench_shebang(benchmark, content_files):
+    """Shebang detection of an extensionless script."""
+    path = content_files["shebang"]
+    result = benchmark(lambda: FileTypeDetector()._detect_by_content(path))
+    assert result == "hash"
+
+
+@pytest.mark.benchmark(group="keywords")
+def test_bench_keywords(benchmark, content_files):
+    """Keyword scan of an extensionless source file."""
+    path = content_files["keywords"]
+    result = benchmark(lambda: FileTypeDetector()._detect_by_content(path))
+    assert result == "hash"
+
+
+@pytest.mark.benchmark(group="binary")
+def test_bench_binary(benchmark, content_files):
+    """Binary file rejected by the NUL byte check."""
+    path = content_files["binary"]
+    result = benchmark(lambda: FileTypeDetector()._detect_by_content(path))
+    assert result is None
@@ -3,9 +3,18 @@
 import pytest
 import tempfile
 import shutil
+import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+from template_customizer.core.resolver import _create_jinja_env
+from template_customizer.utils.file_types import FileTypeDetector
+
 
 @pytest.fixture
 def temp_dir():
@@ -15,6 +24,69 @@ def temp_dir():
     shutil.rmtree(temp_path)
 
 
+@pytest.fixture(scope="session")
+def detector():
+    """Shared FileTypeDetector instance for the whole test session."""
+    return FileTypeDetector()
+
+
+@pytest.fixture(scope="module")
+def shared_env():
+    """Jinja2 environment shared by the ParameterLoaders of one test module.
+    
+    Built like the production environment, with the same filters and
+    Undefined handling.
+    """
+    return _create_jinja_env()
+
+
+def build_large_config() -> Dict[str, Any]:
+    """Build a configuration with 200 simple and 50 chained references."""
+    pairs = [("base", {"value": "test"})]
+    
+    # Add 200 simple references
+    pairs.extend(
+        (f"simple_{i}", f"{{{{ values.base.value }}}}-{i}") for i in range(200)
+    )
+    
+    # Add 50 chained references
+    pairs.append(("chain_0", "{{ values.base.value }}-chain"))
+    pairs.extend(
+        (f"chain_{i}", f"{{{{ values.chain_{i-1} }}}}-{i}") for i in range(1, 50)
+    )
+    
+    return dict(pairs)
+
+
+def build_deep_config(depth: int = 20) -> Dict[str, Any]:
+    """Build a configuration where each level references the previous one."""
+    config_data = {}
+    for i in range(depth):
+        if i == 0:
+            config_data[f"level_{i}"] = "base"
+        else:
+            config_data[f"level_{i}"] = f"{{{{ values.level_{i-1} }}}}-{i}"
+    return config_data
+
+
+@pytest.fixture(scope="session")
+def large_config_path(tmp_path_factory):
+    """Large reference-heavy YAML config, written once per test session."""
+    config_path = tmp_path_factory.mktemp("cfg") / "large.yml"
+    with open(config_path, "w") as f:
+        yaml.dump(build_large_config(), f, Dumper=SafeDumper)
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def deep_config_path(tmp_path_factory):
+    """20-level deep reference chain YAML config, written once per test session."""
+    config_path = tmp_path_factory.mktemp("cfg") / "deep.yml"
+    with open(config_path, "w") as f:
+        yaml.dump(build_deep_config(20), f, Dumper=SafeDumper)
+    return config_path
+
+
 @pytest.fixture
 def sample_config():
     """Sample configuration parameters for testing."""
@@ -126,6 +126,57 @@ class TestConfigResolver:
         assert "Circular dependency detected" in error_msg
         assert "a" in error_msg and "b" in error_msg and "c" in error_msg
     
+    def test_circular_dependency_path(self):
+        """Test that the reported cycle lists each member once and closes the loop."""
+        config = {
+            "a": "{{ values.b }}",
+            "b": "{{ values.c }}",
+            "c": "{{ values.a }}"
+        }
+        
+        with pytest.raises(CircularReferenceError) as exc_info:
+            self.resolver.resolve(config)
+        
+        assert exc_info.value.cycle_path == ["a", "b", "c"]
+        assert exc_info.value.cycle_display == "a → b → c → a"
+        assert "a → b → c → a" in str(exc_info.value)
+    
+    def test_circular_dependency_reported_from_smallest_key(self):
+        """Test that a cycle is reported the same way whichever node is visited first."""
+        config = {
+            "c": "{{ values.a }}",
+            "b": "{{ values.c }}",
+            "a": "{{ values.b }}"
+        }
+        
+        with pytest.raises(CircularReferenceError) as exc_info:
+            self.resolver.resolve(config)
+        
+        assert exc_info.value.cycle_path == ["a", "b", "c"]
+    
+    def test_all_circular_dependencies_reported(self):
+        """Test that independent cycles are all reported in one error."""
+        config = {
+            "a": "{{ values.b }}",
+            "b": "{{ values.a }}",
+            "ok": "{{ values.a }}-suffix",
+            "x": "{{ values.y }}",
+            "y": "{{ values.z }}",
+            "z": "{{ values.x }}",
+            "self": "{{ values.self }}"
+        }
+        
+        with pytest.raises(CircularReferenceError) as exc_info:
+            self.resolver.resolve(config)
+        
+        assert exc_info.value.cycles == [["a", "b"], ["self"], ["x", "y", "z"]]
+        assert exc_info.value.cycle_path == ["a", "b"]
+        error_msg = str(exc_info.value)
+        assert "Circular dependency detected in 3 cycles" in error_msg
+        assert "a → b → a" in error_msg
+        assert "self → self" in error_msg
+        assert "x → y → z → x" in error_msg
+    
     def test_complex_circular_dependency(self):
         """Test detection of complex circular dependencies."""
         config = {
@@ -274,6 +325,110 @@ class TestConfigResolver:
             "static-service"
         ]
     
+    def test_template_compilation_is_cached(self):
+        """Test that identical template strings are compiled only once."""
+        config = {
+            "project": {"name": "myapp"},
+            "api": {"name": "{{ values.project.name | upper }}-service"},
+            "worker": {"name": "{{ values.project.name | upper }}-service"}
+        }
+        
+        result = self.resolver.resolve(config)
+        
+        assert result["api"]["name"] == "MYAPP-service"
+        assert result["worker"]["name"] == "MYAPP-service"
+        assert list(self.resolver.template_cache) == [
+            "{{ values.project.name | upper }}-service"
+        ]
+    
+    def test_template_compilation_is_shared_across_resolvers(self):
+        """Test that resolvers on the shared environment reuse compiled templates."""
+        config = {
+            "project": {"name": "myapp"},
+            "api": {"name": "{{ values.project.name | upper }}-api"}
+        }
+        first = ConfigResolver()
+        second = ConfigResolver()
+        
+        assert first.resolve(config) == second.resolve(config)
+        source = config["api"]["name"]
+        assert first.template_cache[source] is second.template_cache[source]
+    
+    def test_plain_interpolation_skips_jinja(self):
+        """Test that strings with only plain references are substituted directly."""
+        config = {
+            "project": {"name": "myapp", "port": 8080, "debug": False},
+            "url": "http://{{ values.project.name }}:{{values.project.port}}/",
+            "flags": "debug={{ values.project.debug }}\n",
+            "slug": "{{ values.project.name | replace('app', '') }}-{{ values.project.name }}"
+        }
+        
+        result = self.resolver.resolve(config)
+        
+        assert result["url"] == "http://myapp:8080/"
+        assert result["flags"] == "debug=False"
+        assert result["slug"] == "my-myapp"
+        # Only the string using a filter needed a compiled template
+        assert list(self.resolver.template_cache) == [config["slug"]]
+    
+    def test_jinja_environment_is_shared(self):
+        """Test that resolvers reuse one Jinja2 environment."""
+        other = ConfigResolver()
+        
+        assert other.jinja_env is self.resolver.jinja_env
+        assert "replace" in other.jinja_env.filters
+    
+    def test_injected_jinja_environment(self, shared_env):
+        """Test that an injected Jinja2 environment is used for rendering."""
+        resolver = ConfigResolver(env=shared_env)
+        config = {
+            "project": {"name": "myapp"},
+            "api": {"name": "{{ values.project.name | upper }}-service"}
+        }
+        
+        result = resolver.resolve(config)
+        
+        assert resolver.jinja_env is shared_env
+        assert result["api"]["name"] == "MYAPP-service"
+    
+    def test_each_key_path_resolved_once(self):
+        """Test that final values are memoized instead of re-resolved every pass."""
+        config = {
+            "project": {"name": "shop"},
+            "api": {
+                "name": "{{ values.project.name }}-api",
+                "image": "{{ values.api.name }}:latest",
+                "url": "https://{{ values.api.name }}.example.com"
+            },
+            "health": "{{ values.api.url }}/health"
+        }
+        
+        calls = []
+        original = self.resolver._resolve_key_path
+        
+        def counting(key_path, *args):
+            calls.append(key_path)
+            return original(key_path, *args)
+        
+        self.resolver._resolve_key_path = counting
+        result = self.resolver.resolve(config)
+        
+        assert result["health"] == "https://shop-api.example.com/health"
+        assert len(calls) == len(set(calls))
+    
+    def test_deep_chain_resolved_in_single_pass(self, capsys):
+        """Test that a reference chain in dependency order needs only one pass."""
+        config = {"level_0": "base"}
+        for i in range(1, 50):
+            config[f"level_{i}"] = f"{{{{ values.level_{i - 1} }}}}-{i}"
+        
+        resolver = ConfigResolver(verbose=True)
+        result = resolver.resolve(config)
+        
+        assert result["level_49"].startswith("base-1-2-3")
+        assert result["level_49"].endswith("-48-49")
+        assert "Resolution completed in 1 iteration(s)" in capsys.readouterr().out
+    
     def test_deep_copy_utility(self):
         """Test deep copy utility method."""
         original = {
@@ -2,137 +2,135 @@
 
 import pytest
 from pathlib import Path
-from template_customizer.utils.file_types import FileTypeDetector
 
 
 class TestFileTypeDetector:
     """Test FileTypeDetector class."""
     
-    def test_detect_comment_type_by_extension(self):
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            # Python files
+            ("test.py", "hash"),
+            ("test.pyi", "hash"),
+            # JavaScript/TypeScript files
+            ("test.js", "double_slash"),
+            ("test.jsx", "double_slash"),
+            ("test.ts", "double_slash"),
+            ("test.tsx", "double_slash"),
+            ("test.mjs", "double_slash"),
+            # CSS files
+            ("test.css", "css"),
+            ("test.scss", "css"),
+            ("test.sass", "css"),
+            ("test.less", "css"),
+            # HTML/XML files
+            ("test.html", "html"),
+            ("test.htm", "html"),
+            ("test.xml", "html"),
+            ("test.svg", "html"),
+            # YAML files
+            ("test.yml", "hash"),
+            ("test.yaml", "hash"),
+            # SQL files
+            ("test.sql", "double_dash"),
+            # Shell files
+            ("test.sh", "hash"),
+            ("test.bash", "hash"),
+            ("test.zsh", "hash"),
+            # Java/C/C++ files
+            ("test.java", "double_slash"),
+            ("test.c", "double_slash"),
+            ("test.cpp", "double_slash"),
+            ("test.h", "double_slash"),
+            ("test.hpp", "double_slash"),
+            # Go/Rust/Swift files
+            ("test.go", "double_slash"),
+            ("test.rs", "double_slash"),
+            ("test.swift", "double_slash"),
+            # Config files
+            ("test.toml", "hash"),
+            ("test.cfg", "hash"),
+            ("test.conf", "hash"),
+            ("test.ini", "hash"),
+            # Lua files
+            ("test.lua", "double_dash"),
+            # New languages added in Phase 2
+            ("test.kt", "double_slash"),  # Kotlin
+            ("test.scala", "double_slash"),  # Scala
+            ("test.dart", "double_slash"),  # Dart
+            ("test.php", "double_slash"),  # PHP
+        ],
+    )
+    def test_detect_comment_type_by_extension(self, detector, filename, expected):
         """Test comment type detection by file extension."""
-        detector = FileTypeDetector()
-        
-        # Python files
-        assert detector.detect_comment_type(Path("test.py")) == "hash"
-        assert detector.detect_comment_type(Path("test.pyi")) == "hash"
-        
-        # JavaScript/TypeScript files
-        assert detector.detect_comment_type(Path("test.js")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.jsx")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.ts")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.tsx")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.mjs")) == "double_slash"
-        
-        # CSS files
-        assert detector.detect_comment_type(Path("test.css")) == "css"
-        assert detector.detect_comment_type(Path("test.scss")) == "css"
-        assert detector.detect_comment_type(Path("test.sass")) == "css"
-        assert detector.detect_comment_type(Path("test.less")) == "css"
-        
-        # HTML/XML files
-        assert detector.detect_comment_type(Path("test.html")) == "html"
-        assert detector.detect_comment_type(Path("test.htm")) == "html"
-        assert detector.detect_comment_type(Path("test.xml")) == "html"
-        assert detector.detect_comment_type(Path("test.svg")) == "html"
-        
-        # YAML files
-        assert detector.detect_comment_type(Path("test.yml")) == "hash"
-        assert detector.detect_comment_type(Path("test.yaml")) == "hash"
-        
-        # SQL files
-        assert detector.detect_comment_type(Path("test.sql")) == "double_dash"
-        
-        # Shell files
-        assert detector.detect_comment_type(Path("test.sh")) == "hash"
-        assert detector.detect_comment_type(Path("test.bash")) == "hash"
-        assert detector.detect_comment_type(Path("test.zsh")) == "hash"
-        
-        # Java/C/C++ files
-        assert detector.detect_comment_type(Path("test.java")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.c")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.cpp")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.h")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.hpp")) == "double_slash"
-        
-        # Go/Rust/Swift files
-        assert detector.detect_comment_type(Path("test.go")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.rs")) == "double_slash"
-        assert detector.detect_comment_type(Path("test.swift")) == "double_slash"
-        
-        # Config files
-        assert detector.detect_comment_type(Path("test.toml")) == "hash"
-        assert detector.detect_comment_type(Path("test.cfg")) == "hash"
-        assert detector.detect_comment_type(Path("test.conf")) == "hash"
-        assert detector.detect_comment_type(Path("test.ini")) == "hash"
-        
-        # Lua files
-        assert detector.detect_comment_type(Path("test.lua")) == "double_dash"
-        
-        # New languages added in Phase 2
-        assert detector.detect_comment_type(Path("test.kt")) == "double_slash"  # Kotlin
-        assert detector.detect_comment_type(Path("test.scala")) == "double_slash"  # Scala
-        assert detector.detect_comment_type(Path("test.dart")) == "double_slash"  # Dart
-        assert detector.detect_comment_type(Path("test.php")) == "double_slash"  # PHP
+        assert detector.detect_comment_type(Path(filename)) == expected
     
-    def test_detect_comment_type_by_filename(self):
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            # Docker files
+            ("Dockerfile", "hash"),
+            ("dockerfile", "hash"),
+            # Make files
+            ("Makefile", "hash"),
+            ("makefile", "hash"),
+            # Ruby files
+            ("Rakefile", "hash"),
+            ("Gemfile", "hash"),
+            ("Gemfile.lock", "hash"),
+            # Python packaging
+            ("Pipfile", "hash"),
+            ("Pipfile.lock", "hash"),
+            ("requirements.txt", "hash"),
+            ("requirements-dev.txt", "hash"),
+            ("pyproject.toml", "hash"),
+            ("poetry.lock", "hash"),
+            # Git files
+            (".gitignore", "hash"),
+            (".dockerignore", "hash"),
+            # Environment files
+            (".env", "hash"),
+            (".env.local", "hash"),
+            (".env.example", "hash"),
+            (".env.development", "hash"),
+            (".env.production", "hash"),
+            (".env.test", "hash"),
+            # Rust files
+            ("Cargo.toml", "hash"),
+            ("Cargo.lock", "hash"),
+            # Go files
+            ("go.mod", "double_slash"),
+            ("go.sum", "double_slash"),
+        ],
+    )
+    def test_detect_comment_type_by_filename(self, detector, filename, expected):
         """Test comment type detection by special filename patterns."""
-        detector = FileTypeDetector()
-        
-        # Docker files
-        assert detector.detect_comment_type(Path("Dockerfile")) == "hash"
-        assert detector.detect_comment_type(Path("dockerfile")) == "hash"
-        
-        # Make files
-        assert detector.detect_comment_type(Path("Makefile")) == "hash"
-        assert detector.detect_comment_type(Path("makefile")) == "hash"
-        
-        # Ruby files
-        assert detector.detect_comment_type(Path("Rakefile")) == "hash"
-        assert detector.detect_comment_type(Path("Gemfile")) == "hash"
-        assert detector.detect_comment_type(Path("Gemfile.lock")) == "hash"
-        
-        # Python packaging
-        assert detector.detect_comment_type(Path("Pipfile")) == "hash"
-        assert detector.detect_comment_type(Path("Pipfile.lock")) == "hash"
-        assert detector.detect_comment_type(Path("requirements.txt")) == "hash"
-        assert detector.detect_comment_type(Path("requirements-dev.txt")) == "hash"
-        assert detector.detect_comment_type(Path("pyproject.toml")) == "hash"
-        assert detector.detect_comment_type(Path("poetry.lock")) == "hash"
-        
-        # Git files
-        assert detector.detect_comment_type(Path(".gitignore")) == "hash"
-        assert detector.detect_comment_type(Path(".dockerignore")) == "hash"
-        
-        # Environment files
-        assert detector.detect_comment_type(Path(".env")) == "hash"
-        assert detector.detect_comment_type(Path(".env.local")) == "hash"
-        assert detector.detect_comment_type(Path(".env.example")) == "hash"
-        assert detector.detect_comment_type(Path(".env.development")) == "hash"
-        assert detector.detect_comment_type(Path(".env.production")) == "hash"
-        assert detector.detect_comment_type(Path(".env.test")) == "hash"
-        
-        # Rust files
-        assert detector.detect_comment_type(Path("Cargo.toml")) == "hash"
-        assert detector.detect_comment_type(Path("Cargo.lock")) == "hash"
-        
-        # Go files
-        assert detector.detect_comment_type(Path("go.mod")) == "double_slash"
-        assert detector.detect_comment_type(Path("go.sum")) == "double_slash"
+        assert detector.detect_comment_type(Path(filename)) == expected
+    
+    def test_detect_comment_type_by_filename_family(self, detector):
+        """Test detection for variants of special filenames not listed explicitly."""
+        assert detector.detect_comment_type(Path(".env.staging")) == "hash"
+        assert detector.detect_comment_type(Path("requirements-test.txt")) == "hash"
+        assert detector.detect_comment_type(Path("requirements_prod.txt")) == "hash"
+        assert detector.detect_comment_type(Path("notes.txt")) is None
+        # A known extension wins over the family pattern
+        assert detector.detect_comment_type(Path(".env.json")) == "double_slash"
+        assert detector.detect_comment_type(Path(".env.js")) == "double_slash"
     
-    def test_detect_comment_type_multiple_extensions(self):
+    def test_detect_comment_type_multiple_extensions(self, detector):
         """Test detection for files with multiple extensions."""
-        detector = FileTypeDetector()
-        
         # Environment files with multiple extensions
         assert detector.detect_comment_type(Path("config.env.local")) == "hash"
         assert detector.detect_comment_type(Path("app.config.yml")) == "hash"
         assert detector.detect_comment_type(Path("test.spec.ts")) == "double_slash"
         assert detector.detect_comment_type(Path("component.test.js")) == "double_slash"
+        # A dotfile's first component is its stem, not a suffix
+        assert detector.detect_comment_type(Path(".py.foo.bar")) is None
+        assert detector.detect_comment_type(Path(".eslintrc.local.js")) == "double_slash"
     
-    def test_detect_comment_type_unsupported(self):
+    def test_detect_comment_type_unsupported(self, detector):
         """Test detection for unsupported file types."""
-        detector = FileTypeDetector()
-        
         # Unsupported extensions
         assert detector.detect_comment_type(Path("test.unknown")) is None
         assert detector.detect_comment_type(Path("test.bin")) is None
@@ -142,10 +140,8 @@ class TestFileTypeDetector:
         # Unknown filenames
         assert detector.detect_comment_type(Path("unknown_file")) is None
     
-    def test_detect_by_content_shebang(self, temp_dir):
+    def test_detect_by_content_shebang(self, detector, temp_dir):
         """Test content-based detection using shebang."""
-        detector = FileTypeDetector()
-        
         # Bash script
         bash_script = temp_dir / "script"
         bash_script.write_text("#!/bin/bash\necho 'hello'")
@@ -166,10 +162,8 @@ class TestFileTypeDetector:
         zsh_script.write_text("#!/bin/zsh\necho 'hello'")
         assert detector.detect_comment_type(zsh_script) == "hash"
     
-    def test_detect_by_content_keywords(self, temp_dir):
+    def test_detect_by_content_keywords(self, detector, temp_dir):
         """Test content-based detection using language keywords."""
-        detector = FileTypeDetector()
-        
         # Python-like content
         python_file = temp_dir / "script"
         python_file.write_text("import os\nfrom pathlib import Path\nclass MyClass:\n    pass")
@@ -185,26 +179,41 @@ class TestFileTypeDetector:
         unclear_file.write_text("some random text\nwith no keywords")
         assert detector.detect_comment_type(unclear_file) is None
     
-    def test_detect_by_content_binary_file(self, temp_dir):
+    def test_detect_by_content_binary_file(self, detector, temp_dir):
         """Test content-based detection with binary file."""
-        detector = FileTypeDetector()
-        
         # Binary file
         binary_file = temp_dir / "binary"
         binary_file.write_bytes(b'\x00\x01\x02\x03\xff\xfe\xfd')
         assert detector.detect_comment_type(binary_file) is None
     
-    def test_detect_by_content_nonexistent_file(self):
-        """Test content-based detection with non-existent file."""
-        detector = FileTypeDetector()
+    def test_detect_by_extension_skips_content(self, detector, temp_dir, monkeypatch):
+        """Test that files with an extension are never opened for detection."""
+        def fail(file_path):
+            raise AssertionError(f"unexpected content read of {file_path}")
         
+        monkeypatch.setattr(detector, "_detect_by_content", fail)
+        
+        js_in_py = temp_dir / "script.py"
+        js_in_py.write_text("const name = 'test';")
+        assert detector.detect_comment_type(js_in_py) == "hash"
+        
+        unknown = temp_dir / "notes.txt"
+        unknown.write_text("#!/bin/bash\necho 'hello'")
+        assert detector.detect_comment_type(unknown) is None
+    
+    def test_detect_by_content_empty_file(self, detector, temp_dir):
+        """Test content-based detection with an empty file."""
+        empty_file = temp_dir / "empty"
+        empty_file.write_bytes(b"")
+        assert detector.detect_comment_type(empty_file) is None
+    
+    def test_detect_by_content_nonexistent_file(self, detector):
+        """Test content-based detection with non-existent file."""
         # Non-existent file with no extension should return None
         assert detector.detect_comment_type(Path("nonexistent")) is None
     
-    def test_is_supported_file(self):
+    def test_is_supported_file(self, detector):
         """Test checking if file is supported."""
-        detector = FileTypeDetector()
-        
         # Supported files
         assert detector.is_supported_file(Path("test.py")) is True
         assert detector.is_supported_file(Path("test.js")) is True
@@ -215,10 +224,8 @@ class TestFileTypeDetector:
         assert detector.is_supported_file(Path("test.unknown")) is False
         assert detector.is_supported_file(Path("test.bin")) is False
     
-    def test_get_supported_extensions(self):
+    def test_get_supported_extensions(self, detector):
         """Test getting list of supported extensions."""
-        detector = FileTypeDetector()
-        
         extensions = detector.get_supported_extensions()
         
         # Should contain all the extensions we defined
@@ -234,10 +241,8 @@ class TestFileTypeDetector:
         # Should be a reasonable number of extensions
         assert len(extensions) > 30  # We have many extensions
     
-    def test_get_comment_syntax_info(self):
+    def test_get_comment_syntax_info(self, detector):
         """Test getting comment syntax information."""
-        detector = FileTypeDetector()
-        
         # Hash comments
         info = detector.get_comment_syntax_info("hash")
         assert info['single_line'] == "#"
@@ -268,10 +273,8 @@ class TestFileTypeDetector:
         info = detector.get_comment_syntax_info("unknown")
         assert info == {}
     
-    def test_case_insensitive_detection(self):
+    def test_case_insensitive_detection(self, detector):
         """Test that filename detection is case insensitive."""
-        detector = FileTypeDetector()
-        
         # Different cases should work
         assert detector.detect_comment_type(Path("DOCKERFILE")) == "hash"
         assert detector.detect_comment_type(Path("DockerFile")) == "hash"
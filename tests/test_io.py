@@ -0,0 +1,40 @@
+"""Test file reading helpers."""
+
+import os
+
+import pytest
+
+from template_customizer.utils.io import SMALL_FILE_SIZE, read_lines
+
+
+class TestReadLines:
+    """Test read_lines function."""
+    
+    @pytest.mark.parametrize("size", [0, 100, SMALL_FILE_SIZE + 100])
+    def test_read_lines_matches_text_mode(self, tmp_path, size):
+        """read_lines returns the same lines as a text-mode readlines."""
+        body = ("é line\r\nmac line\rlast line\n" * (size // 30 + 1))[:size]
+        path = tmp_path / "sample.txt"
+        path.write_bytes(body.encode("utf-8"))
+        
+        with open(path, encoding="utf-8") as f:
+            expected = f.readlines()
+        
+        assert read_lines(path) == expected
+    
+    def test_read_lines_rejects_binary(self, tmp_path):
+        """Undecodable files raise UnicodeDecodeError like open() does."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"\xff\xfe\x00binary")
+        
+        with pytest.raises(UnicodeDecodeError):
+            read_lines(path)
+    
+    @pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs procfs")
+    def test_read_lines_zero_size_file(self):
+        """Files that report a size of 0 are still read completely."""
+        assert os.stat("/proc/self/status").st_size == 0
+        
+        lines = read_lines("/proc/self/status")
+        
+        assert any(line.startswith("Name:") for line in lines)
\ No newline at end of file
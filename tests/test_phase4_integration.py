@@ -3,74 +3,118 @@
 import os
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
 from click.testing import CliRunner
+from template_customizer import cli as cli_module
 from template_customizer.cli import main as cli
 from template_customizer.core.scanner import FileScanner
 
+# Fixture file contents, encoded once; %d placeholders take module/file indices
+_PY_TEMPLATE_BYTES = b'''# project_name = {{ project.name }}
+PROJECT_NAME = "default_project"
+
+# version = {{ project.version }}
+VERSION = "0.0.1"
+
+def process_%d_%d():
+    """Process function %d-%d"""
+    pass
+'''
+
+_JS_TEMPLATE_BYTES = b'''// api_url = {{ api.base_url }}
+const API_URL = "http://localhost:8000";
+
+// app_name = {{ project.name }}
+const APP_NAME = "default_app";
+
+function init_%d_%d() {
+    console.log("Initializing %d-%d");
+}
+'''
+
+_CONFIG_TEMPLATE_BYTES = b'''# module_name = {{ modules.module_%d.name }}
+module_name: "module_%d"
+
+# enabled = {{ modules.module_%d.enabled }}
+enabled: false
+'''
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _write_bytes(path, data: bytes):
+    """Write a fixture file with raw syscalls, bypassing pathlib and text encoding."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_files(files):
+    """Write a {path: bytes} mapping of fixture files on a small thread pool.
+
+    Parent directories must already exist.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() re-raises the first failed write
+        list(executor.map(_write_bytes, files.keys(), files.values()))
+
+
+@pytest.fixture(scope="class")
+def runner():
+    """One CliRunner shared by the CLI tests of a class."""
+    return CliRunner()
+
 
 class TestLargeDirectoryProcessing:
     """Test processing of large directory structures."""
     
     def create_large_project(self, root_dir: Path, num_dirs: int = 10, files_per_dir: int = 20):
         """Create a large project structure for testing."""
+        # Directories are created first; the files are written in one batch
+        files = {}
+        
         # Create source directories
         for i in range(num_dirs):
-            dir_path = root_dir / f"module_{i}"
-            dir_path.mkdir(parents=True)
+            dir_path = os.path.join(root_dir, f"module_{i}")
+            os.makedirs(dir_path)
             
             # Add Python files with template markers
             for j in range(files_per_dir):
-                py_file = dir_path / f"file_{j}.py"
-                py_file.write_text(f'''# project_name = {{{{ project.name }}}}
-PROJECT_NAME = "default_project"
-
-# version = {{{{ project.version }}}}
-VERSION = "0.0.1"
-
-def process_{i}_{j}():
-    """Process function {i}-{j}"""
-    pass
-''')
+                files[os.path.join(dir_path, f"file_{j}.py")] = (
+                    _PY_TEMPLATE_BYTES % (i, j, i, j)
+                )
             
             # Add some JS files
             for j in range(5):
-                js_file = dir_path / f"script_{j}.js"
-                js_file.write_text(f'''// api_url = {{{{ api.base_url }}}}
-const API_URL = "http://localhost:8000";
-
-// app_name = {{{{ project.name }}}}
-const APP_NAME = "default_app";
-
-function init_{i}_{j}() {{
-    console.log("Initializing {i}-{j}");
-}}
-''')
+                files[os.path.join(dir_path, f"script_{j}.js")] = (
+                    _JS_TEMPLATE_BYTES % (i, j, i, j)
+                )
             
             # Add config files
-            config_file = dir_path / "config.yml"
-            config_file.write_text(f'''# module_name = {{{{ modules.module_{i}.name }}}}
-module_name: "module_{i}"
-
-# enabled = {{{{ modules.module_{i}.enabled }}}}
-enabled: false
-''')
+            files[os.path.join(dir_path, "config.yml")] = (
+                _CONFIG_TEMPLATE_BYTES % (i, i, i)
+            )
         
         # Add directories that should be excluded
         excluded_dirs = [".git", "node_modules", "__pycache__", ".venv", "dist", "build"]
         for exc_dir in excluded_dirs:
-            exc_path = root_dir / exc_dir
-            exc_path.mkdir(parents=True)
+            exc_path = os.path.join(root_dir, exc_dir)
+            os.makedirs(exc_path)
             # Add some files that should be ignored
-            (exc_path / "file.txt").write_text("This should be ignored")
-            (exc_path / "data.json").write_text('{"ignored": true}')
+            files[os.path.join(exc_path, "file.txt")] = b"This should be ignored"
+            files[os.path.join(exc_path, "data.json")] = b'{"ignored": true}'
         
         # Add test files that might be excluded
-        test_dir = root_dir / "tests"
-        test_dir.mkdir()
+        test_dir = os.path.join(root_dir, "tests")
+        os.mkdir(test_dir)
         for i in range(10):
-            (test_dir / f"test_module_{i}.py").write_text(f"# Test file {i}")
+            files[os.path.join(test_dir, f"test_module_{i}.py")] = b"# Test file %d" % i
+        
+        _write_files(files)
     
     def test_large_directory_scanning(self, tmp_path):
         """Test scanning performance with large directory structure."""
@@ -99,7 +143,34 @@ enabled: false
         assert len(js_files) == 75   # 15 dirs * 5 files
         assert len(yml_files) == 15  # 15 dirs * 1 file
     
-    def test_large_directory_processing_cli(self, tmp_path):
+    def test_parallel_scan_matches_sequential_scan(self, tmp_path):
+        """Test that a parallel scan finds exactly the files a sequential one does."""
+        self.create_large_project(tmp_path, num_dirs=8, files_per_dir=5)
+        
+        sequential = list(FileScanner(project_path=tmp_path).scan())
+        parallel = list(FileScanner(project_path=tmp_path, parallel=True, workers=4).scan())
+        
+        assert len(parallel) == len(sequential)
+        assert set(parallel) == set(sequential)
+    
+    def test_excluded_directories_are_not_listed(self, tmp_path, monkeypatch):
+        """Test that excluded directories are pruned before being opened."""
+        self.create_large_project(tmp_path, num_dirs=2, files_per_dir=2)
+        
+        listed = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            listed.append(os.path.basename(path))
+            return real_scandir(path)
+        
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+        files = list(FileScanner(project_path=tmp_path).scan())
+        
+        assert len(files) == 2 * (2 + 5 + 1) + 10
+        assert sorted(listed[1:]) == ["module_0", "module_1", "tests"]
+    
+    def test_large_directory_processing_cli(self, runner, tmp_path):
         """Test CLI processing of large directory with progress reporting."""
         # Create large project
         self.create_large_project(tmp_path, num_dirs=10, files_per_dir=15)
@@ -122,7 +193,6 @@ modules:
     enabled: true
 ''')
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'process',
             '--project', str(tmp_path),
@@ -136,6 +206,50 @@ modules:
         assert "Template Customizer" in result.output
         # Check that files were processed (either found changes or no changes to apply)
         assert "Found" in result.output or "No changes to apply" in result.output
+    
+    def test_parallel_jobs_match_sequential_processing(self, runner, tmp_path):
+        """Test that --jobs spreads files over workers without changing the result."""
+        self.create_large_project(tmp_path, num_dirs=3, files_per_dir=4)
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(
+            "project:\n  name: JobsProject\n  version: 3.0.0\n"
+            "api:\n  base_url: https://api.example.com\n"
+        )
+        
+        outputs = []
+        for jobs in ("1", "2"):
+            result = runner.invoke(cli, [
+                'process',
+                '--project', str(tmp_path),
+                '--config', str(config_file),
+                '--jobs', jobs,
+                '--dry-run',
+                '--verbose'
+            ])
+            assert result.exit_code == 0, result.output
+            outputs.append(result.output)
+        
+        assert "Processed:" in outputs[0]
+        assert outputs[0] == outputs[1]
+    
+    def test_failed_worker_result_is_reported_per_file(self, monkeypatch, tmp_path):
+        """Test that a file whose analysis fails in the pool does not stop the others."""
+        paths = [tmp_path / f"file_{i}.py" for i in range(5)]
+        
+        def analyze(file_path):
+            if file_path.name == "file_2.py":
+                raise RuntimeError("cannot pickle result")
+            return cli_module._FileResult(file_path, "no_markers")
+        
+        monkeypatch.setattr(cli_module, "_analyze_in_worker", analyze)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(cli_module._analyze_in_pool(executor, paths, max_pending=2))
+        
+        assert [r.file_path for r in results] == paths
+        assert [r.status for r in results] == [
+            "no_markers", "no_markers", "process_error", "no_markers", "no_markers"
+        ]
+        assert results[2].error == "cannot pickle result"
 
 
 class TestComplexPatternFiltering:
@@ -143,36 +257,31 @@ class TestComplexPatternFiltering:
     
     def create_mixed_project(self, root_dir: Path):
         """Create a project with mixed file types for pattern testing."""
-        # Source files
-        src_dir = root_dir / "src"
-        src_dir.mkdir()
-        (src_dir / "main.py").write_text("# main = {{ project.name }}\nMAIN = 'default'")
-        (src_dir / "utils.py").write_text("# utils = {{ project.name }}\nUTILS = 'default'")
-        (src_dir / "helpers.js").write_text("// helper = {{ project.name }}\nconst HELPER = 'default';")
-        (src_dir / "styles.css").write_text("/* theme = {{ ui.theme }} */\n.theme { color: blue; }")
-        
-        # Test files
-        test_dir = root_dir / "tests"
-        test_dir.mkdir()
-        (test_dir / "test_main.py").write_text("# test = {{ project.name }}\nTEST = 'default'")
-        (test_dir / "test_utils.py").write_text("# test = {{ project.name }}\nTEST = 'default'")
-        (test_dir / "e2e.spec.js").write_text("// e2e = {{ project.name }}\nconst E2E = 'default';")
-        
-        # Config files
-        (root_dir / "config.yml").write_text("# config = {{ project.name }}\nname: default")
-        (root_dir / "settings.json").write_text('{"setting": "{{ project.name }}"}')
-        (root_dir / ".env.template").write_text("# env = {{ project.name }}\nAPP_NAME=default")
-        
-        # Documentation
-        docs_dir = root_dir / "docs"
-        docs_dir.mkdir()
-        (docs_dir / "README.md").write_text("# Docs = {{ project.name }}")
-        (docs_dir / "api.md").write_text("# API = {{ project.name }}")
-        
-        # Build artifacts (should usually be excluded)
-        build_dir = root_dir / "build"
-        build_dir.mkdir()
-        (build_dir / "output.js").write_text("// build = {{ project.name }}")
+        files = {
+            # Source files
+            "src/main.py": b"# main = {{ project.name }}\nMAIN = 'default'",
+            "src/utils.py": b"# utils = {{ project.name }}\nUTILS = 'default'",
+            "src/helpers.js": b"// helper = {{ project.name }}\nconst HELPER = 'default';",
+            "src/styles.css": b"/* theme = {{ ui.theme }} */\n.theme { color: blue; }",
+            # Test files
+            "tests/test_main.py": b"# test = {{ project.name }}\nTEST = 'default'",
+            "tests/test_utils.py": b"# test = {{ project.name }}\nTEST = 'default'",
+            "tests/e2e.spec.js": b"// e2e = {{ project.name }}\nconst E2E = 'default';",
+            # Config files
+            "config.yml": b"# config = {{ project.name }}\nname: default",
+            "settings.json": b'{"setting": "{{ project.name }}"}',
+            ".env.template": b"# env = {{ project.name }}\nAPP_NAME=default",
+            # Documentation
+            "docs/README.md": b"# Docs = {{ project.name }}",
+            "docs/api.md": b"# API = {{ project.name }}",
+            # Build artifacts (should usually be excluded)
+            "build/output.js": b"// build = {{ project.name }}",
+        }
+        
+        for subdir in ("src", "tests", "docs", "build"):
+            os.mkdir(os.path.join(root_dir, subdir))
+        for rel_path, content in files.items():
+            _write_bytes(os.path.join(root_dir, rel_path), content)
     
     def test_include_only_python_files(self, tmp_path):
         """Test including only Python files."""
@@ -232,7 +341,56 @@ class TestComplexPatternFiltering:
         assert not any("/build/" in f for f in file_strs)
         assert not any("/tests/" in f for f in file_strs)
     
-    def test_cli_with_pattern_filtering(self, tmp_path):
+    def test_include_pattern_with_directory_prefix(self, tmp_path, monkeypatch):
+        """Test that a single include pattern under a directory only walks that directory."""
+        self.create_mixed_project(tmp_path)
+        
+        listed = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            listed.append(os.path.relpath(path, tmp_path))
+            return real_scandir(path)
+        
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+        files = FileScanner(project_path=tmp_path, include_patterns=["src/*.py"]).scan()
+        
+        assert sorted(f.name for f in files) == ["main.py", "utils.py"]
+        assert listed == ["src"]
+        # Excluded directories stay excluded when named by the prefix
+        assert list(FileScanner(project_path=tmp_path, include_patterns=["build/*"]).scan()) == []
+    
+    @pytest.mark.parametrize("include", [
+        ["*.py", "src/*", "docs/[[]*", "?ain.*"],
+        ["*.py", "*.js"],
+    ])
+    @pytest.mark.parametrize("path", [
+        "src/main.py", "main.py", "tests/test_main.py", "e2e.spec.js",
+        "node_modules/pkg/index.js", "docs/[draft].md", "binary", ".gitignore",
+        "lib/cache.pyc", "notes.py.txt"
+    ])
+    def test_compiled_patterns_match_fnmatch(self, tmp_path, path, include):
+        """Test that the combined pattern regex agrees with per-pattern fnmatch."""
+        import fnmatch
+        
+        exclude = ["binary", "docs", "node_modules/pkg/index.js"]
+        scanner = FileScanner(
+            project_path=tmp_path, include_patterns=include, exclude_patterns=exclude
+        )
+        name = os.path.basename(path)
+        
+        expected_excluded = any(
+            fnmatch.fnmatch(path, p) or fnmatch.fnmatch(name, p)
+            for p in scanner.exclude_patterns
+        )
+        expected_included = not expected_excluded and any(
+            fnmatch.fnmatch(path, p) or fnmatch.fnmatch(name, p) for p in include
+        )
+        
+        assert scanner._is_excluded_directory(path, name) == expected_excluded
+        assert scanner._should_include(path, name) == expected_included
+    
+    def test_cli_with_pattern_filtering(self, runner, tmp_path):
         """Test CLI with include/exclude patterns."""
         self.create_mixed_project(tmp_path)
         
@@ -240,8 +398,6 @@ class TestComplexPatternFiltering:
         config_file = tmp_path / "template.yml"
         config_file.write_text("project:\n  name: PatternTest\nui:\n  theme: dark")
         
-        runner = CliRunner()
-        
         # Test 1: Include only Python files
         result = runner.invoke(cli, [
             'process',
@@ -271,7 +427,7 @@ class TestComplexPatternFiltering:
 class TestRichOutputFormatting:
     """Test Rich output formatting and progress reporting."""
     
-    def test_progress_reporting_output(self, tmp_path):
+    def test_progress_reporting_output(self, runner, tmp_path):
         """Test that progress reporting works correctly."""
         # Create a project with multiple files
         for i in range(5):
@@ -281,7 +437,6 @@ class TestRichOutputFormatting:
         config_file = tmp_path / "config.yml"
         config_file.write_text("project:\n  name: TestProject")
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'process',
             '--project', str(tmp_path),
@@ -294,7 +449,7 @@ class TestRichOutputFormatting:
         # Rich adds ANSI codes, so we check for key content
         assert "Template Customizer" in result.output
     
-    def test_dry_run_table_formatting(self, tmp_path):
+    def test_dry_run_table_formatting(self, runner, tmp_path):
         """Test dry-run mode shows formatted table of changes."""
         # Create test file
         test_file = tmp_path / "app.py"
@@ -308,7 +463,6 @@ VERSION = "0.1.0"
         config_file = tmp_path / "config.yml"
         config_file.write_text("project:\n  name: MyApp\n  version: 1.0.0")
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'process',
             '--project', str(tmp_path),
@@ -323,10 +477,8 @@ VERSION = "0.1.0"
         # Either show changes or indicate no changes found
         assert "Found" in result.output or "No changes to apply" in result.output
     
-    def test_error_formatting(self, tmp_path):
+    def test_error_formatting(self, runner, tmp_path):
         """Test error message formatting."""
-        runner = CliRunner()
-        
         # Test with non-existent config
         result = runner.invoke(cli, [
             'process',
@@ -337,7 +489,7 @@ VERSION = "0.1.0"
         assert result.exit_code != 0
         assert "Error" in result.output or "not found" in result.output
     
-    def test_summary_panel_display(self, tmp_path):
+    def test_summary_panel_display(self, runner, tmp_path):
         """Test summary panel is displayed correctly."""
         # Create a simple project
         (tmp_path / "file1.py").write_text("# x = {{ x }}\nX = 1")
@@ -346,7 +498,6 @@ VERSION = "0.1.0"
         config_file = tmp_path / "config.yml"
         config_file.write_text("x: 10\ny: 20")
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'process',
             '--project', str(tmp_path),
@@ -361,23 +512,26 @@ VERSION = "0.1.0"
 
 # Performance test for large directories
 @pytest.mark.slow
+@pytest.mark.xdist_group("timing")
 def test_performance_large_directory(tmp_path):
     """Test performance with very large directory (marked as slow test)."""
     # Create a very large project structure
+    content = b"# pkg = {{ package.name }}\nPKG = 'default'"
+    files = {}
     for i in range(50):
-        dir_path = tmp_path / f"package_{i}"
-        dir_path.mkdir()
+        dir_path = os.path.join(tmp_path, f"package_{i}")
+        os.mkdir(dir_path)
         for j in range(50):
-            file = dir_path / f"module_{j}.py"
-            file.write_text(f"# pkg = {{{{ package.name }}}}\nPKG = 'default'")
+            files[os.path.join(dir_path, f"module_{j}.py")] = content
+    _write_files(files)
     
     scanner = FileScanner(project_path=tmp_path)
     import time
     
     start_time = time.time()
-    files = list(scanner.scan())
+    file_count = sum(1 for _ in scanner.scan())
     scan_time = time.time() - start_time
     
-    assert len(files) == 2500  # 50 * 50
+    assert file_count == 2500  # 50 * 50
     assert scan_time < 10.0  # Should complete within 10 seconds
-    print(f"Scanned {len(files)} files in {scan_time:.2f} seconds")
\ No newline at end of file
+    print(f"Scanned {file_count} files in {scan_time:.2f} seconds")
\ No newline at end of file
@@ -1,9 +1,9 @@
 """Integration tests for ConfigResolver with ParameterLoader and CLI."""
 
+import json
 import tempfile
 from pathlib import Path
 import pytest
-import yaml
 
 from template_customizer.core.processor import ParameterLoader
 from template_customizer.core.exceptions import CircularReferenceError, ReferenceResolutionError
@@ -21,25 +21,17 @@ class TestResolverIntegration:
             "docker": {"image": "{{ values.project.name }}:latest"}
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        # Test with resolution enabled (default)
+        loader = ParameterLoader(text=json.dumps(config_data), resolve_references=True)
+        result = loader.load()
         
-        try:
-            # Test with resolution enabled (default)
-            loader = ParameterLoader(config_path, resolve_references=True)
-            result = loader.load()
-            
-            assert result["docker"]["image"] == "testapp:latest"
-            
-            # Test with resolution disabled
-            loader_no_resolve = ParameterLoader(config_path, resolve_references=False)
-            result_no_resolve = loader_no_resolve.load()
-            
-            assert result_no_resolve["docker"]["image"] == "{{ values.project.name }}:latest"
-            
-        finally:
-            config_path.unlink()
+        assert result["docker"]["image"] == "testapp:latest"
+        
+        # Test with resolution disabled
+        loader_no_resolve = ParameterLoader(text=json.dumps(config_data), resolve_references=False)
+        result_no_resolve = loader_no_resolve.load()
+        
+        assert result_no_resolve["docker"]["image"] == "{{ values.project.name }}:latest"
     
     def test_parameter_loader_with_circular_references(self):
         """Test ParameterLoader error handling for circular references."""
@@ -48,21 +40,13 @@ class TestResolverIntegration:
             "b": "{{ values.a }}"
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        loader = ParameterLoader(text=json.dumps(config_data), resolve_references=True)
         
-        try:
-            loader = ParameterLoader(config_path, resolve_references=True)
-            
-            with pytest.raises(ValueError) as exc_info:
-                loader.load()
-            
-            # Verify it's specifically a circular reference error
-            assert "Circular dependency detected" in str(exc_info.value)
-                
-        finally:
-            config_path.unlink()
+        with pytest.raises(ValueError) as exc_info:
+            loader.load()
+        
+        # Verify it's specifically a circular reference error
+        assert "Circular dependency detected" in str(exc_info.value)
     
     def test_parameter_loader_with_missing_references(self):
         """Test ParameterLoader error handling for missing references."""
@@ -70,26 +54,16 @@ class TestResolverIntegration:
             "app": {"name": "{{ values.missing.reference }}"}
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        loader = ParameterLoader(text=json.dumps(config_data), resolve_references=True)
         
-        try:
-            loader = ParameterLoader(config_path, resolve_references=True)
-            
-            with pytest.raises(ValueError) as exc_info:
-                loader.load()
-            
-            # Verify it's specifically a reference resolution error
-            assert "Reference resolution failed" in str(exc_info.value)
-                
-        finally:
-            config_path.unlink()
+        with pytest.raises(ValueError) as exc_info:
+            loader.load()
+        
+        # Verify it's specifically a reference resolution error
+        assert "Reference resolution failed" in str(exc_info.value)
     
     def test_json_configuration_with_references(self):
         """Test reference resolution with JSON configuration files."""
-        import json
-        
         config_data = {
             "project": {"name": "jsonapp"},
             "api": {"endpoint": "https://{{ values.project.name }}.api.com"}
@@ -124,7 +98,7 @@ class TestResolverIntegration:
             
             # Write config file
             with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+                json.dump(config_data, f)
             
             # Write test file with template marker
             test_file.write_text('# service_url = {{ values.service.url }}\nservice_url = "default"\n')
@@ -185,32 +159,25 @@ class TestResolverIntegration:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        loader = ParameterLoader(text=json.dumps(config_data), resolve_references=True)
+        result = loader.load()
         
-        try:
-            loader = ParameterLoader(config_path, resolve_references=True)
-            result = loader.load()
-            
-            # Verify complex nested resolution
-            assert result["resources"]["bucket_name"] == "my-microservice-prod-assets"
-            assert result["resources"]["database_name"] == "my_microservice_production"
-            assert result["resources"]["lambda_prefix"] == "prod-my-microservice"
-            
-            # Verify chained references
-            expected_registry = "123456789012.dkr.ecr.us-east-1.amazonaws.com"
-            assert result["docker"]["registry"] == expected_registry
-            assert result["docker"]["image"] == f"{expected_registry}/my-microservice:1.2.3"
-            
-            # Verify deeply nested references
-            expected_base_url = "https://prod-my-microservice.us-east-1.amazonaws.com"
-            assert result["api"]["base_url"] == expected_base_url
-            assert result["api"]["health_check"] == f"{expected_base_url}/health"
-            
-        finally:
-            config_path.unlink()
+        # Verify complex nested resolution
+        assert result["resources"]["bucket_name"] == "my-microservice-prod-assets"
+        assert result["resources"]["database_name"] == "my_microservice_production"
+        assert result["resources"]["lambda_prefix"] == "prod-my-microservice"
+        
+        # Verify chained references
+        expected_registry = "123456789012.dkr.ecr.us-east-1.amazonaws.com"
+        assert result["docker"]["registry"] == expected_registry
+        assert result["docker"]["image"] == f"{expected_registry}/my-microservice:1.2.3"
+        
+        # Verify deeply nested references
+        expected_base_url = "https://prod-my-microservice.us-east-1.amazonaws.com"
+        assert result["api"]["base_url"] == expected_base_url
+        assert result["api"]["health_check"] == f"{expected_base_url}/health"
     
+    @pytest.mark.xdist_group("timing")
     def test_performance_with_large_configuration(self):
         """Test performance with larger configuration files."""
         import time
@@ -232,7 +199,7 @@ class TestResolverIntegration:
             }
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
+            json.dump(config_data, f)
             config_path = Path(f.name)
         
         try:
@@ -268,21 +235,13 @@ docker:
   image: "{{ values.project.name }}:latest"
 '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            f.write(config_yaml)
-            config_path = Path(f.name)
+        loader = ParameterLoader(text=config_yaml, resolve_references=True)
         
-        try:
-            loader = ParameterLoader(config_path, resolve_references=True)
-            
-            with pytest.raises(ValueError) as exc_info:
-                loader.load()
-            
-            error_msg = str(exc_info.value)
-            assert "Reference resolution failed" in error_msg
-            
-        finally:
-            config_path.unlink()
+        with pytest.raises(ValueError) as exc_info:
+            loader.load()
+        
+        error_msg = str(exc_info.value)
+        assert "Reference resolution failed" in error_msg
     
     def test_backward_compatibility(self):
         """Test that existing configurations without references still work."""
@@ -298,21 +257,44 @@ docker:
             "features": ["auth", "api", "frontend"]
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        # Test with resolver enabled
+        loader = ParameterLoader(text=json.dumps(config_data), resolve_references=True)
+        result_with_resolver = loader.load()
         
-        try:
-            # Test with resolver enabled
-            loader = ParameterLoader(config_path, resolve_references=True)
-            result_with_resolver = loader.load()
-            
-            # Test with resolver disabled
-            loader_no_resolve = ParameterLoader(config_path, resolve_references=False)
-            result_no_resolver = loader_no_resolve.load()
-            
-            # Results should be identical
-            assert result_with_resolver == result_no_resolver == config_data
-            
-        finally:
-            config_path.unlink()
\ No newline at end of file
+        # Test with resolver disabled
+        loader_no_resolve = ParameterLoader(text=json.dumps(config_data), resolve_references=False)
+        result_no_resolver = loader_no_resolve.load()
+        
+        # Results should be identical
+        assert result_with_resolver == result_no_resolver == config_data
+    
+    def test_parameter_loader_with_parsed_data(self):
+        """Test resolving a configuration that is already a dictionary."""
+        config_data = {
+            "project": {"name": "dataapp"},
+            "docker": {"image": "{{ values.project.name }}:latest"}
+        }
+        
+        result = ParameterLoader(data=config_data).load()
+        raw = ParameterLoader(data=config_data, resolve_references=False).load()
+        
+        assert result["docker"]["image"] == "dataapp:latest"
+        assert raw == config_data
+        assert raw is not config_data
+    
+    def test_parameter_loader_requires_one_source(self, tmp_path):
+        """Test that exactly one configuration source must be given."""
+        with pytest.raises(ValueError):
+            ParameterLoader()
+        with pytest.raises(ValueError):
+            ParameterLoader(tmp_path / "config.yml", text="name: app")
+    
+    def test_json_configuration_outside_orjson_subset(self, tmp_path):
+        """Test that JSON orjson rejects still loads through the standard library."""
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(b'{"limit": NaN, "big": 123456789012345678901234567890}')
+        
+        result = ParameterLoader(config_path, resolve_references=False).load()
+        
+        assert result["limit"] != result["limit"]  # NaN
+        assert result["big"] == 123456789012345678901234567890
@@ -1,9 +1,9 @@
 """Tests for version management functionality."""
 
+import dataclasses
+import operator
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
 
 from template_customizer.utils.version import (
     SemanticVersion, 
@@ -17,6 +17,104 @@ from template_customizer.utils.version_bump import (
     get_version_changelog_entry
 )
 
+_INIT_CONTENT = '''"""Template Customizer - Comment-based template processing tool."""
+
+__version__ = "0.1.0"
+__author__ = "Template Customizer"
+__description__ = "A tool for customizing project templates using comment-based markers"
+'''
+
+_INIT_RELPATH = "src/template_customizer/__init__.py"
+
+_PYPROJECT_CONTENT = '''[project]
+name = "template-customizer"
+version = "0.1.0"
+description = "Test project"
+'''
+
+
+# Shared expected versions; SemanticVersion is frozen, so reuse is safe
+V100 = SemanticVersion(1, 0, 0)
+V123 = SemanticVersion(1, 2, 3)
+V_10_20_30 = SemanticVersion(10, 20, 30)
+V100_ALPHA = SemanticVersion(1, 0, 0, prerelease="alpha")
+V100_ALPHA_1 = SemanticVersion(1, 0, 0, prerelease="alpha.1")
+V100_BUILD = SemanticVersion(1, 0, 0, build="build")
+V100_ALPHA_BUILD = SemanticVersion(1, 0, 0, prerelease="alpha", build="build")
+
+VALID_CASES = (
+    ("1.0.0", V100),
+    ("1.2.3", V123),
+    ("10.20.30", V_10_20_30),
+    ("1.0.0-alpha", V100_ALPHA),
+    ("1.0.0-alpha.1", V100_ALPHA_1),
+    ("1.0.0+build", V100_BUILD),
+    ("1.0.0-alpha+build", V100_ALPHA_BUILD),
+)
+
+INVALID_VERSIONS = (
+    "1.0",
+    "1.0.0.0",
+    "v1.0.0",
+    "1.0.0-",
+    "1.0.0+",
+    "not.a.version",
+    "",
+    "1.2.3-alpha-",
+)
+
+COMPARE_CASES = (
+    ("1.0.0", "1.0.1", -1),
+    ("1.0.1", "1.0.0", 1),
+    ("1.0.0", "1.0.0", 0),
+)
+
+COMPATIBLE_CASES = (
+    ("1.0.0", "1.2.3", True),
+    ("1.0.0", "2.0.0", False),
+)
+
+NEXT_VERSION_CASES = (
+    ("major", "2.0.0"),
+    ("minor", "1.3.0"),
+    ("patch", "1.2.4"),
+)
+
+
+@pytest.fixture(scope="module")
+def project_template(tmp_path_factory):
+    """Project layout with versioned files, built once; tests must not modify it."""
+    root = tmp_path_factory.mktemp("version_project")
+    
+    # Create __init__.py with version
+    init_file = root / _INIT_RELPATH
+    init_file.parent.mkdir(parents=True)
+    init_file.write_text(_INIT_CONTENT)
+    
+    # Create pyproject.toml
+    (root / "pyproject.toml").write_text(_PYPROJECT_CONTENT)
+    return root
+
+
+@pytest.fixture(scope="class")
+def bumper_project(tmp_path_factory):
+    """Project directory shared by the mutating bumper tests of one class."""
+    root = tmp_path_factory.mktemp("vbumper")
+    (root / _INIT_RELPATH).parent.mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def project_root(bumper_project):
+    """Project layout reset to the initial versions for a test that bumps them.
+    
+    The directory tree is built once per class; only the two versioned files
+    are rewritten, which undoes whatever the previous test bumped.
+    """
+    (bumper_project / _INIT_RELPATH).write_text(_INIT_CONTENT)
+    (bumper_project / "pyproject.toml").write_text(_PYPROJECT_CONTENT)
+    return bumper_project
+
 
 class TestSemanticVersion:
     """Test SemanticVersion class."""
@@ -42,12 +140,21 @@ class TestSemanticVersion:
         assert version.build == "20230101"
         assert str(version) == "1.0.0+20230101"
     
-    def test_version_string_representation(self):
+    @pytest.mark.parametrize("args,kwargs,expected", [
+        ((1, 2, 3), {}, "1.2.3"),
+        ((1, 0, 0), {"prerelease": "alpha"}, "1.0.0-alpha"),
+        ((1, 0, 0), {"build": "123"}, "1.0.0+123"),
+        ((1, 0, 0), {"prerelease": "alpha", "build": "123"}, "1.0.0-alpha+123"),
+    ])
+    def test_version_string_representation(self, args, kwargs, expected):
         """Test string representation of versions."""
-        assert str(SemanticVersion(1, 2, 3)) == "1.2.3"
-        assert str(SemanticVersion(1, 0, 0, prerelease="alpha")) == "1.0.0-alpha"
-        assert str(SemanticVersion(1, 0, 0, build="123")) == "1.0.0+123"
-        assert str(SemanticVersion(1, 0, 0, prerelease="alpha", build="123")) == "1.0.0-alpha+123"
+        assert str(SemanticVersion(*args, **kwargs)) == expected
+    
+    def test_dataclass_fields_are_public_parts_only(self):
+        """Test that precedence bookkeeping does not leak into the dataclass fields."""
+        assert dataclasses.asdict(V100_ALPHA_BUILD) == {
+            "major": 1, "minor": 0, "patch": 0, "prerelease": "alpha", "build": "build"
+        }
     
     def test_version_equality(self):
         """Test version equality comparison."""
@@ -57,40 +164,52 @@ class TestSemanticVersion:
         
         assert v1 == v2
         assert v1 != v3
+        # Build metadata does not affect equality, so not hashing either
+        v4 = SemanticVersion(1, 2, 3, build="456")
+        assert v1 == v4
+        assert hash(v1) == hash(v4)
     
-    def test_version_comparison(self):
+    @pytest.mark.parametrize("left,op,right,expected", [
+        ((1, 0, 0), operator.lt, (1, 1, 0), True),
+        ((1, 1, 0), operator.lt, (2, 0, 0), True),
+        ((2, 0, 0), operator.gt, (1, 0, 0), True),
+        ((1, 0, 0), operator.le, (1, 1, 0), True),
+        ((2, 0, 0), operator.ge, (1, 0, 0), True),
+        ((1, 1, 0), operator.lt, (1, 0, 0), False),
+        ((1, 0, 0), operator.le, (1, 0, 0), True),
+        ((1, 0, 0), operator.gt, (1, 0, 0), False),
+    ])
+    def test_version_comparison(self, left, op, right, expected):
         """Test version comparison operators."""
-        v1 = SemanticVersion(1, 0, 0)
-        v2 = SemanticVersion(1, 1, 0)
-        v3 = SemanticVersion(2, 0, 0)
-        
-        assert v1 < v2
-        assert v2 < v3
-        assert v3 > v1
-        assert v1 <= v2
-        assert v3 >= v1
+        assert op(SemanticVersion(*left), SemanticVersion(*right)) is expected
     
-    def test_prerelease_comparison(self):
+    @pytest.mark.parametrize("lower,higher", [
+        ("alpha", "beta"),
+        ("beta", None),  # Normal version > prerelease
+        ("alpha", "alpha.1"),  # Longer identifier list wins
+        ("alpha.2", "alpha.10"),  # Numeric identifiers compare as integers
+        ("alpha.9", "alpha.beta"),  # Numeric < alphanumeric
+        ("rc.1", None),
+    ])
+    def test_prerelease_comparison(self, lower, higher):
         """Test prerelease version comparison."""
-        v1 = SemanticVersion(1, 0, 0, prerelease="alpha")
-        v2 = SemanticVersion(1, 0, 0, prerelease="beta")
-        v3 = SemanticVersion(1, 0, 0)
+        v1 = SemanticVersion(1, 0, 0, prerelease=lower)
+        v2 = SemanticVersion(1, 0, 0, prerelease=higher)
         
         assert v1 < v2
-        assert v2 < v3  # Normal version > prerelease
+        assert not v2 < v1
     
-    def test_compatibility_check(self):
+    @pytest.mark.parametrize("other,expected", [
+        ((1, 3, 0), True),
+        ((2, 0, 0), False),
+    ])
+    def test_compatibility_check(self, other, expected):
         """Test version compatibility checking."""
-        v1 = SemanticVersion(1, 2, 3)
-        v2 = SemanticVersion(1, 3, 0)
-        v3 = SemanticVersion(2, 0, 0)
-        
-        assert v1.is_compatible_with(v2)
-        assert not v1.is_compatible_with(v3)
+        assert V123.is_compatible_with(SemanticVersion(*other)) is expected
     
     def test_version_bumping(self):
         """Test version bumping methods."""
-        version = SemanticVersion(1, 2, 3)
+        version = V123
         
         major_bump = version.bump_major()
         assert major_bump == SemanticVersion(2, 0, 0)
@@ -105,38 +224,26 @@ class TestSemanticVersion:
 class TestVersionParser:
     """Test VersionParser class."""
     
-    def test_parse_valid_versions(self):
+    @pytest.mark.parametrize(
+        "version_string,expected", VALID_CASES, ids=[c[0] for c in VALID_CASES]
+    )
+    def test_parse_valid_versions(self, version_string, expected):
         """Test parsing valid version strings."""
-        test_cases = [
-            ("1.0.0", SemanticVersion(1, 0, 0)),
-            ("1.2.3", SemanticVersion(1, 2, 3)),
-            ("10.20.30", SemanticVersion(10, 20, 30)),
-            ("1.0.0-alpha", SemanticVersion(1, 0, 0, prerelease="alpha")),
-            ("1.0.0-alpha.1", SemanticVersion(1, 0, 0, prerelease="alpha.1")),
-            ("1.0.0+build", SemanticVersion(1, 0, 0, build="build")),
-            ("1.0.0-alpha+build", SemanticVersion(1, 0, 0, prerelease="alpha", build="build")),
-        ]
-        
-        for version_string, expected in test_cases:
-            result = VersionParser.parse(version_string)
-            assert result == expected
+        assert VersionParser.parse(version_string) == expected
     
-    def test_parse_invalid_versions(self):
+    @pytest.mark.parametrize("invalid_version", INVALID_VERSIONS)
+    def test_parse_invalid_versions(self, invalid_version):
         """Test parsing invalid version strings."""
-        invalid_versions = [
-            "1.0",
-            "1.0.0.0",
-            "v1.0.0",
-            "1.0.0-",
-            "1.0.0+",
-            "not.a.version",
-            "",
-            "1.2.3-alpha-",
-        ]
+        with pytest.raises(ValueError):
+            VersionParser.parse(invalid_version)
+    
+    def test_parse_returns_shared_versions(self):
+        """Test that repeated parses of a string share one immutable version."""
+        version = VersionParser.parse("1.2.3-rc.1")
         
-        for invalid_version in invalid_versions:
-            with pytest.raises(ValueError):
-                VersionParser.parse(invalid_version)
+        assert VersionParser.parse("1.2.3-rc.1") is version
+        with pytest.raises(AttributeError):
+            version.major = 2
     
     def test_is_valid(self):
         """Test version validation."""
@@ -144,76 +251,48 @@ class TestVersionParser:
         assert VersionParser.is_valid("1.2.3-alpha.1")
         assert not VersionParser.is_valid("1.0")
         assert not VersionParser.is_valid("invalid")
+        assert not VersionParser.is_valid("")
+        assert not VersionParser.is_valid("v1.0.0")
+        assert VersionParser.is_valid(" 1.0.0 ")
 
 
 class TestVersionManager:
     """Test VersionManager class."""
     
-    def test_compare_versions(self):
+    @pytest.mark.parametrize("left,right,expected", COMPARE_CASES)
+    def test_compare_versions(self, left, right, expected):
         """Test version comparison."""
-        assert VersionManager.compare_versions("1.0.0", "1.0.1") == -1
-        assert VersionManager.compare_versions("1.0.1", "1.0.0") == 1
-        assert VersionManager.compare_versions("1.0.0", "1.0.0") == 0
+        assert VersionManager.compare_versions(left, right) == expected
     
-    def test_is_compatible(self):
+    @pytest.mark.parametrize("left,right,expected", COMPATIBLE_CASES)
+    def test_is_compatible(self, left, right, expected):
         """Test compatibility checking."""
-        assert VersionManager.is_compatible("1.0.0", "1.2.3")
-        assert not VersionManager.is_compatible("1.0.0", "2.0.0")
+        assert VersionManager.is_compatible(left, right) is expected
     
-    def test_get_next_version(self):
+    @pytest.mark.parametrize("bump_type,expected", NEXT_VERSION_CASES)
+    def test_get_next_version(self, bump_type, expected):
         """Test getting next version."""
-        assert VersionManager.get_next_version("1.2.3", "major") == "2.0.0"
-        assert VersionManager.get_next_version("1.2.3", "minor") == "1.3.0"
-        assert VersionManager.get_next_version("1.2.3", "patch") == "1.2.4"
-        
+        assert VersionManager.get_next_version("1.2.3", bump_type) == expected
+    
+    def test_get_next_version_invalid_type(self):
+        """Test that an unknown bump type is rejected."""
         with pytest.raises(ValueError):
             VersionManager.get_next_version("1.2.3", "invalid")
 
 
+@pytest.mark.xdist_group("verbumper")
 class TestVersionBumper:
     """Test VersionBumper class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.project_root = self.temp_dir
-        
-        # Create directory structure
-        src_dir = self.project_root / "src" / "template_customizer"
-        src_dir.mkdir(parents=True)
-        
-        # Create __init__.py with version
-        init_file = src_dir / "__init__.py"
-        init_content = '''"""Template Customizer - Comment-based template processing tool."""
-
-__version__ = "0.1.0"
-__author__ = "Template Customizer"
-__description__ = "A tool for customizing project templates using comment-based markers"
-'''
-        init_file.write_text(init_content)
-        
-        # Create pyproject.toml
-        pyproject_file = self.project_root / "pyproject.toml"
-        pyproject_content = '''[project]
-name = "template-customizer"
-version = "0.1.0"
-description = "Test project"
-'''
-        pyproject_file.write_text(pyproject_content)
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_get_current_version(self):
+    def test_get_current_version(self, project_template):
         """Test getting current version."""
-        bumper = VersionBumper(self.project_root)
+        bumper = VersionBumper(project_template)
         version = bumper.get_current_version()
         assert version == "0.1.0"
     
-    def test_bump_version_dry_run(self):
+    def test_bump_version_dry_run(self, project_template):
         """Test version bumping in dry run mode."""
-        bumper = VersionBumper(self.project_root)
+        bumper = VersionBumper(project_template)
         
         new_version = bumper.bump_version("minor", dry_run=True)
         assert new_version == "0.2.0"
@@ -222,9 +301,9 @@ description = "Test project"
         current_version = bumper.get_current_version()
         assert current_version == "0.1.0"
     
-    def test_bump_version_live(self):
+    def test_bump_version_live(self, project_root):
         """Test actual version bumping."""
-        bumper = VersionBumper(self.project_root)
+        bumper = VersionBumper(project_root)
         
         new_version = bumper.bump_version("patch", dry_run=False)
         assert new_version == "0.1.1"
@@ -233,9 +312,9 @@ description = "Test project"
         current_version = bumper.get_current_version()
         assert current_version == "0.1.1"
     
-    def test_bump_major_version(self):
+    def test_bump_major_version(self, project_root):
         """Test major version bump."""
-        bumper = VersionBumper(self.project_root)
+        bumper = VersionBumper(project_root)
         
         new_version = bumper.bump_version("major", dry_run=False)
         assert new_version == "1.0.0"
@@ -244,20 +323,13 @@ description = "Test project"
         assert current_version == "1.0.0"
 
 
+@pytest.mark.xdist_group("verchecker")
 class TestVersionCompatibilityChecker:
     """Test VersionCompatibilityChecker class."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_compatible_config(self):
+    def test_compatible_config(self, tmp_path: Path):
         """Test checking compatible config."""
-        config_file = self.temp_dir / "config.yml"
+        config_file = tmp_path / "config.yml"
         config_content = """
 project:
   name: test
@@ -274,16 +346,13 @@ customizer_version: "1.2.0"
     
     def test_incompatible_config(self):
         """Test checking incompatible config."""
-        config_file = self.temp_dir / "config.yml"
         config_content = """
 project:
   name: test
 customizer_version: "2.0.0"
 """
-        config_file.write_text(config_content)
-        
-        is_compatible, warning = VersionCompatibilityChecker.check_config_compatibility(
-            config_file, "1.3.0"
+        is_compatible, warning = VersionCompatibilityChecker._check_config_text(
+            config_content, "1.3.0"
         )
         
         assert not is_compatible
@@ -292,16 +361,13 @@ customizer_version: "2.0.0"
     
     def test_config_without_version(self):
         """Test config file without version information."""
-        config_file = self.temp_dir / "config.yml"
         config_content = """
 project:
   name: test
   description: A test project
 """
-        config_file.write_text(config_content)
-        
-        is_compatible, warning = VersionCompatibilityChecker.check_config_compatibility(
-            config_file, "1.0.0"
+        is_compatible, warning = VersionCompatibilityChecker._check_config_text(
+            config_content, "1.0.0"
         )
         
         assert is_compatible
@@ -325,4 +391,5 @@ def test_get_version_info():
     
     assert isinstance(version_string, str)
     assert isinstance(version_obj, SemanticVersion)
-    assert str(version_obj) == version_string
\ No newline at end of file
+    assert str(version_obj) == version_string
+    assert get_version_info() is get_version_info()
\ No newline at end of file